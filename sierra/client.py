@@ -103,8 +103,20 @@ class SierraDevelopmentClient:
         )
         self.logger.log("Cache manager initialized", "debug")
 
+        # One long-lived, pooled client shared by every sideloader thread
+        # (8 by default, see SierraSideloader's max_concurrency), so TCP and
+        # TLS setup is paid once per host. The keep-alive pool leaves room
+        # for a raised max_concurrency. HTTP/2 multiplexes requests over one
+        # connection per host when h2 is installed.
         self.http_client: httpx.Client = httpx.Client(
-            headers={"User-Agent": "Sierra-dev/1.0"}
+            headers={"User-Agent": "Sierra-dev/1.0"},
+            transport=httpx.HTTPTransport(
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(
+                    max_connections=32, max_keepalive_connections=16
+                ),
+                retries=3,
+            ),
         )
         self.logger.log("HTTP client initialized", "debug")
 
@@ -215,7 +227,12 @@ class SierraDevelopmentClient:
         """
         path_obj: pathlib.Path = pathlib.Path(path_to_invoker).resolve()
 
-        self.logger.log(f"Importing module from: {path_obj}", "debug")
+        self.logger.log(
+            sierra_internal_logger.LazyMessage(
+                lambda: f"Importing module from: {path_obj}"
+            ),
+            "debug",
+        )
 
         if not path_obj.is_file() or path_obj.suffix != ".py":
             raise sierra_internal_errors.SierraClientPathError(
@@ -466,8 +466,10 @@ class SierraChecker(sierra_core_base.SierraCoreObject):
         
         try:
             import yaml
+            # Prefer the libyaml-backed loader when PyYAML was built with it
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
             with open(config_path, 'r') as f:
-                config_data = yaml.safe_load(f)
+                config_data = yaml.load(f, Loader=loader)
             
             if config_data is None:
                 self.add_issue(
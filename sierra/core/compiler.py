@@ -1,12 +1,90 @@
+import concurrent.futures
+import functools
+import io
+import itertools
+import os
+import pathlib
 import re
 import subprocess
+import types
 import typing
 
 import sierra.core.base as sierra_core_base
 import sierra.internal.errors as sierra_internal_errors
 
-if typing.TYPE_CHECKING:
-    import pathlib
+# Parameter types emitted as ``Type: FILE`` in config.yaml
+_PATH_TYPES: tuple[type, ...] = (pathlib.Path, pathlib.PurePath)
+
+# Pinned requirement such as ``package==1.2.3``; empty version parts are rejected
+_VERSIONED_PATTERN: re.Pattern[str] = re.compile(
+    r"^(?P<name>[A-Za-z0-9_\-]+)==(?P<version>[0-9]+(?:\.[0-9]+)*)$"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_version(version: str) -> tuple[int, ...]:
+    """
+    Convert a dotted numeric version string into a comparable tuple.
+
+    Parameters
+    ----------
+    version : str
+        Version string already validated by ``_VERSIONED_PATTERN``.
+
+    Returns
+    -------
+    tuple[int, ...]
+        Integer components of the version.
+    """
+    return tuple(map(int, version.split(".")))
+
+
+def _is_path_type(type_obj: typing.Any) -> bool:
+    """
+    Check whether a parameter annotation denotes a filesystem path.
+
+    Parameters
+    ----------
+    type_obj : Any
+        Annotation as recorded by the invoker: a class, a union such as
+        ``pathlib.Path | None``, or a string annotation.
+
+    Returns
+    -------
+    bool
+        True if the parameter should be emitted as ``Type: FILE``.
+    """
+    # Identity check first; classes are the common case
+    if type_obj in _PATH_TYPES:
+        return True
+    if isinstance(type_obj, type):
+        return issubclass(type_obj, pathlib.PurePath)
+    if isinstance(type_obj, types.UnionType) or (
+        typing.get_origin(type_obj) is typing.Union
+    ):
+        return any(_is_path_type(arg) for arg in typing.get_args(type_obj))
+    text = str(type_obj)
+    return text == "Path" or "pathlib.Path" in text
+
+
+def _write_bytes(path: pathlib.Path, data: bytes) -> None:
+    """
+    Write ``data`` to ``path`` through a raw file descriptor.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Destination file, created or truncated as needed.
+    data : bytes
+        Complete file content.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
 
 
 class SierraCompiler(sierra_core_base.SierraCoreObject):
@@ -43,8 +121,25 @@ class SierraCompiler(sierra_core_base.SierraCoreObject):
         3. Write config.yaml in the root of the environment.
     """
 
-    @classmethod
-    def to_double_quoted_string(cls, text: str) -> str:
+    # Per-parameter YAML blocks keyed by (is_file, mandatory)
+    _PARAM_TPL_STRING: typing.ClassVar[str] = (
+        "\n      - Name: %s\n        Description: %s\n        Type: STRING"
+    )
+    _PARAM_TPL_FILE: typing.ClassVar[str] = (
+        "\n      - Name: %s\n        Description: %s\n        Type: FILE"
+    )
+    _PARAM_TPL_MANDATORY: typing.ClassVar[str] = (
+        "\n        Options:\n          - MANDATORY"
+    )
+    _PARAM_TEMPLATES: typing.ClassVar[dict[tuple[bool, bool], str]] = {
+        (False, False): _PARAM_TPL_STRING,
+        (False, True): _PARAM_TPL_STRING + _PARAM_TPL_MANDATORY,
+        (True, False): _PARAM_TPL_FILE,
+        (True, True): _PARAM_TPL_FILE + _PARAM_TPL_MANDATORY,
+    }
+
+    @staticmethod
+    def to_double_quoted_string(text: str) -> str:
         r"""
         Return the given string wrapped in double quotes.
 
@@ -74,23 +169,20 @@ class SierraCompiler(sierra_core_base.SierraCoreObject):
         '"\'quoted\'"'
         """
         # Remove surrounding quotes if any
-        stripped: str = text
-        if stripped.startswith('"') and stripped.endswith('"'):
-            stripped = stripped[1:-1]
-        
+        stripped: str = (
+            text[1:-1] if text and text[0] == '"' == text[-1] else text
+        )
         # Only quote if there are spaces
-        if " " in stripped:
-            return f'"{stripped}"'
-        return stripped
+        return f'"{stripped}"' if " " in stripped else stripped
 
     def set_invoker_commands(self) -> None:
         """Generate and set the CLI command string for each registered invoker."""
-        self.client.logger.log("Compile: Generating invoker commands", "debug")
+        log = self.client.logger.log
+        generate_command = self.client.builder.generate_command
+        log("Compile: Generating invoker commands", "debug")
         for invoker in self.client.invokers:
-            command = self.client.builder.generate_command(
-                invoker=invoker
-            )
-            self.client.logger.log(
+            command = generate_command(invoker=invoker)
+            log(
                 f"Compile: Generated command for invoker {invoker.name}: {command}",
                 "debug",
             )
@@ -105,14 +197,46 @@ class SierraCompiler(sierra_core_base.SierraCoreObject):
             "debug",
         )
         invokers_dir.mkdir(parents=True, exist_ok=True)
-        for invoker in self.client.invokers:
-            script_path = invokers_dir / f"{invoker.name}.py"
-            self.client.logger.log(
-                f"Compile: Writing script for invoker {invoker.name} to {script_path}",
-                "debug",
-            )
-            with script_path.open("w", encoding="utf-8") as f:
-                f.write(self.client.builder.build(invoker=invoker))
+        build = self.client.builder.build
+        scripts: list[tuple[pathlib.Path, str]] = [
+            (invokers_dir / f"{invoker.name}.py", build(invoker=invoker))
+            for invoker in self.client.invokers
+        ]
+        if not scripts:
+            return
+        # Scripts are built serially above; only the writes are fanned out
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(32, len(scripts))
+        ) as executor:
+            list(executor.map(self._write_script, scripts))
+
+    def _write_script(self, script: tuple[pathlib.Path, str]) -> None:
+        """
+        Write a single generated invoker script to disk.
+
+        The file is left untouched when its current content already matches,
+        so unchanged scripts keep their modification time.
+
+        Parameters
+        ----------
+        script : tuple[pathlib.Path, str]
+            Destination path and generated script content.
+        """
+        script_path, content = script
+        data = content.encode("utf-8")
+        try:
+            if script_path.read_bytes() == data:
+                self.client.logger.log(
+                    f"Compile: Script unchanged, skipping {script_path}",
+                    "debug",
+                )
+                return
+        except FileNotFoundError:
+            pass
+        self.client.logger.log(
+            f"Compile: Writing script to {script_path}", "debug"
+        )
+        _write_bytes(script_path, data)
 
     def make_invoker_yaml(self) -> str:
         """
@@ -129,56 +253,43 @@ class SierraCompiler(sierra_core_base.SierraCoreObject):
         )
         env = self.client.environment
         invokers_dir = str(env.invokers_path)
-        lines: list[str] = []
+        buf = io.StringIO()
+        write = buf.write
+        templates = self._PARAM_TEMPLATES
         # PATHS
-        lines.append("PATHS:")
-        lines.append(f"  - '{invokers_dir}'")
+        write(f"PATHS:\n  - '{invokers_dir}'")
 
         # SCRIPTS
-        lines.append("SCRIPTS:")
+        write("\nSCRIPTS:")
         for inv in self.client.invokers:
-            lines.append(f"  - Name: {inv.name}")
+            write(f"\n  - Name: {inv.name}")
             desc = inv.description or ""
-            lines.append(f"    Description: {desc}")
-            lines.append("    Params:")
+            write(f"\n    Description: {desc}")
+            write("\n    Params:")
             for param in inv.params:
-                name = param.get("Name")
-                pdesc = param.get("Description") or ""
-                lines.append(f"      - Name: {name}")
-                lines.append(f"        Description: {pdesc}")
-                
-                type_obj = param.get("Type")
-                # Check for Path type (either class or string representation)
-                is_file = False
-                if isinstance(type_obj, type):
-                    if type_obj.__name__ == "Path" or type_obj.__module__ == "pathlib":
-                        is_file = True
-                elif str(type_obj) == "Path" or "pathlib.Path" in str(type_obj):
-                    is_file = True
-                
-                if is_file:
-                    lines.append("        Type: FILE")
-                else:
-                    lines.append("        Type: STRING")
-                    
-                if param.get("Options") == "MANDATORY":
-                    lines.append("        Options:")
-                    lines.append("          - MANDATORY")
-            
-            lines.append(f"    Command: >{inv.command}")
-
-        yaml_str = "\n".join(lines)
-        return yaml_str
-
-    def merge_deduplicate_sorted_latest(self, *lists: list[str]) -> list[str]:
+                is_file = _is_path_type(param.get("Type"))
+                mandatory = param.get("Options") == "MANDATORY"
+                write(
+                    templates[is_file, mandatory]
+                    % (param.get("Name"), param.get("Description") or "")
+                )
+
+            write(f"\n    Command: >{inv.command}")
+
+        return buf.getvalue()
+
+    def merge_deduplicate_sorted_latest(
+        self, items: typing.Iterable[str]
+    ) -> list[str]:
         """
-        Merge multiple lists of strings, remove duplicates, and retain only the highest version
+        Merge requirement strings, remove duplicates, and retain only the highest version
         of versioned entries like 'package==x.y.z'. The final result is sorted alphabetically.
 
         Parameters
         ----------
-        *lists : list of list of str
-            Multiple input lists containing string elements.
+        items : Iterable[str]
+            Flat iterable of requirement strings, e.g. every invoker's
+            requirements chained together.
 
         Returns
         -------
@@ -188,40 +299,34 @@ class SierraCompiler(sierra_core_base.SierraCoreObject):
         self.client.logger.log(
             "Compile: Merging and deduplicating package lists", "debug"
         )
-        versioned_pattern = re.compile(
-            r"^(?P<name>[a-zA-Z0-9_\-]+)==(?P<version>[0-9\.]+)$"
-        )
+        versioned_pattern = _VERSIONED_PATTERN
 
         latest_packages: dict[str, str] = {}
         plain_strings: set[str] = set()
 
-        self.client.logger.log("Compile: Iterating over input lists", "debug")
-        for sublist in lists:
-            self.client.logger.log(
-                f"Compile: Processing sublist: {sublist}", "debug"
-            )
-            for item in sublist:
-                match = versioned_pattern.match(item)
-                if match:
-                    self.client.logger.log(
-                        f"Compile: Found versioned item: {item}", "debug"
-                    )
-                    name = match.group("name")
-                    version = match.group("version")
-                    existing = latest_packages.get(name)
-                    if existing is None or tuple(
-                        map(int, version.split("."))
-                    ) > tuple(map(int, existing.split("."))):
-                        self.client.logger.log(
-                            f"Compile: Updating latest version for {name} to {version}",
-                            "debug",
-                        )
-                        latest_packages[name] = version
-                else:
+        self.client.logger.log("Compile: Iterating over requirements", "debug")
+        for item in items:
+            match = versioned_pattern.match(item)
+            if match:
+                self.client.logger.log(
+                    f"Compile: Found versioned item: {item}", "debug"
+                )
+                name = match.group("name")
+                version = match.group("version")
+                existing = latest_packages.get(name)
+                if existing is None or _parse_version(
+                    version
+                ) > _parse_version(existing):
                     self.client.logger.log(
-                        f"Compile: Found plain string: {item}", "debug"
+                        f"Compile: Updating latest version for {name} to {version}",
+                        "debug",
                     )
-                    plain_strings.add(item)
+                    latest_packages[name] = version
+            else:
+                self.client.logger.log(
+                    f"Compile: Found plain string: {item}", "debug"
+                )
+                plain_strings.add(item)
 
         self.client.logger.log(
             "Compile: Merging plain strings and latest packages", "debug"
@@ -238,12 +343,17 @@ class SierraCompiler(sierra_core_base.SierraCoreObject):
         1. Generate CLI command strings for invokers
         2. Write standalone Python scripts
         3. Write config.yaml in the root of the environment.
+
+        When no invokers are registered only an empty config.yaml is written,
+        so stale entries from a previous build do not linger.
         """
         self.client.logger.log("Compile: Starting process", "info")
-        # 1. Build CLI commands
-        self.set_invoker_commands()
-        # 2. Write scripts
-        self.build_and_save_scripts()
+        has_invokers = bool(self.client.invokers)
+        if has_invokers:
+            # 1. Build CLI commands
+            self.set_invoker_commands()
+            # 2. Write scripts
+            self.build_and_save_scripts()
         # 3. Generate YAML
         yaml_content = self.make_invoker_yaml()
         config_path = self.client.environment.config_path / "config.yaml"
@@ -251,28 +361,23 @@ class SierraCompiler(sierra_core_base.SierraCoreObject):
             f"Compile: Writing config.yaml to: {config_path}", "info"
         )
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        with config_path.open("w", encoding="utf-8") as f:
-            f.write(yaml_content)
-        pip_path: pathlib.Path = self.client.environment._get_venv_executable(  # type: ignore
-            "pip"
-        )
+        _write_bytes(config_path, yaml_content.encode("utf-8"))
+        if not has_invokers:
+            self.client.logger.log(
+                "Compile: No invokers registered, skipping scripts and dependencies",
+                "info",
+            )
+            return
         python_path: pathlib.Path = (
             self.client.environment._get_venv_executable(  # type: ignore
                 "python"
             )
         )
-        self.client.logger.log(f"Pip executable path: {pip_path}", "debug")
-        if not pip_path.exists():
-            self.client.logger.log(
-                "Pip not found in virtual environment", "error"
-            )
-            raise sierra_internal_errors.SierraExecutionError(
-                "pip not found in virtual environment."
-            )
         self.client.logger.log(
             f"Python executable path: {python_path}", "debug"
         )
-        if not python_path.exists():
+        executables = self.client.environment._scan_venv_executables()  # type: ignore
+        if python_path.name not in executables:
             self.client.logger.log(
                 "Python not found in virtual environment", "error"
             )
@@ -280,15 +385,25 @@ class SierraCompiler(sierra_core_base.SierraCoreObject):
                 "python not found in virtual environment."
             )
         # 4. Install dependencies
-        list_of_requirements: list[list[str]] = []
-        for invoker in self.client.invokers:
-            list_of_requirements.append(invoker.requirements)
         self.client.logger.log(
             "Merging and deduplicating requirements", "debug"
         )
-        reqs = self.merge_deduplicate_sorted_latest(*list_of_requirements)
+        reqs = self.merge_deduplicate_sorted_latest(
+            itertools.chain.from_iterable(
+                invoker.requirements for invoker in self.client.invokers
+            )
+        )
         # reqs.append("sierra-dev")
-        cmd = [*([str(python_path), str(pip_path), "install"]), *reqs]
+        # Run pip as a module so only one interpreter starts up
+        cmd = [
+            str(python_path),
+            "-m",
+            "pip",
+            "install",
+            "--no-input",
+            "--disable-pip-version-check",
+            *reqs,
+        ]
         self.client.logger.log(
             f"Installing dependencies with command: {' '.join(cmd)}", "debug"
         )
@@ -297,18 +412,20 @@ class SierraCompiler(sierra_core_base.SierraCoreObject):
                 subprocess.run(
                     cmd,
                     check=True,
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                 )
                 self.client.logger.log(
                     "Dependencies installed successfully", "info"
                 )
             except subprocess.CalledProcessError as error:
+                stderr = error.stderr.decode("utf-8", errors="replace")
                 self.client.logger.log(
-                    f"Error during dependency installation: {error.stderr.decode('utf-8')}",
+                    f"Error during dependency installation: {stderr}",
                     "error",
                 )
                 raise sierra_internal_errors.SierraExecutionError(
-                    f"Failed to install dependencies: {error.stderr.decode('utf-8')}"
+                    f"Failed to install dependencies: {stderr}"
                 )
         else:
             self.client.logger.log("No dependencies to install", "info")
@@ -1,7 +1,8 @@
+import collections
+import functools
+import os
 import pathlib
-import platform
-import shutil
-import subprocess
+import stat
 import sys
 import typing
 
@@ -12,6 +13,98 @@ if typing.TYPE_CHECKING:
     import sierra.client as sierra_client
 
 
+# Fixed for the life of the process
+_IS_WINDOWS: bool = sys.platform.startswith("win")
+
+# Initial content of the environment's ``source`` file
+_DEFAULT_SOURCE: bytes = (
+    b"https://api.github.com/repos/xsyncio/sierra-source/contents\n"
+)
+
+
+def _fast_rmtree(path: pathlib.Path) -> None:
+    """
+    Recursively delete ``path`` as cheaply as the platform allows.
+
+    On POSIX the tree is removed in-process with ``shutil.rmtree``, which
+    already deletes relative to open directory descriptors there. On Windows
+    ``rmdir /S /Q`` is tried first and ``shutil.rmtree`` is the fallback.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Directory to remove.
+
+    Raises
+    ------
+    FileNotFoundError
+        If ``path`` does not exist.
+    OSError
+        If the directory cannot be removed.
+    """
+    # Deferred: most runs never destroy an environment
+    import shutil
+
+    if not _IS_WINDOWS:
+        shutil.rmtree(path)
+        return
+
+    import subprocess
+
+    try:
+        subprocess.run(
+            ["cmd", "/c", "rmdir", "/S", "/Q", str(path)],
+            check=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        if not os.path.lexists(path):
+            return
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    shutil.rmtree(path)
+
+
+@functools.lru_cache(maxsize=64)
+def _venv_executable(
+    bin_dir: pathlib.Path, name: str, suffix: str
+) -> pathlib.Path:
+    """
+    Build (and memoize) the path of an executable inside a venv bin directory.
+
+    Parameters
+    ----------
+    bin_dir : pathlib.Path
+        The venv ``bin`` or ``Scripts`` directory.
+    name : str
+        Executable name without extension.
+    suffix : str
+        Platform executable suffix, ``".exe"`` or ``""``.
+
+    Returns
+    -------
+    pathlib.Path
+        Path to the executable.
+    """
+    return bin_dir / f"{name}{suffix}"
+
+
+@functools.lru_cache(maxsize=1)
+def _find_uv() -> typing.Optional[str]:
+    """
+    Locate the ``uv`` installer on PATH, probing only once per process.
+
+    Returns
+    -------
+    str or None
+        Path to the ``uv`` executable, or None if it is not installed.
+    """
+    import shutil
+
+    return shutil.which("uv")
+
+
 class Environment(typing.TypedDict, total=False):
     name: str
     path: pathlib.Path
@@ -41,143 +134,230 @@ class SierraDevelopmentEnvironment(sierra_core_base.SierraCoreObject):
         """
         # Step 1: Bind client and log start
         self.client = client
-        self.client.logger.log("Starting environment initialization", "debug")
+        # Cached so disabled debug lines skip building their f-strings
+        self._debug_enabled: bool = client.logger.is_enabled_for("debug")
+        if self._debug_enabled:
+            self.client.logger.log("Starting environment initialization", "debug")
 
         # Step 2: Set name and path
         self.name: str = kwrags.get("name", "sierra_config")
         if " " in self.name:
             raise ValueError("Environment name cannot contain spaces")
-        self.client.logger.log(f"Environment name set to {self.name}", "debug")
+        if self._debug_enabled:
+            self.client.logger.log(f"Environment name set to {self.name}", "debug")
         self.path: pathlib.Path = kwrags.get("path", pathlib.Path.cwd())
-        self.client.logger.log(f"Base path set to {self.path}", "debug")
+        if self._debug_enabled:
+            self.client.logger.log(f"Base path set to {self.path}", "debug")
 
         # Step 3: Compute derived paths
         self.config_path: pathlib.Path = self.path / self.name
-        self.client.logger.log(f"Config path {self.config_path}", "debug")
+        if self._debug_enabled:
+            self.client.logger.log(f"Config path {self.config_path}", "debug")
         self.venv_path: pathlib.Path = self.config_path / "venv"
-        self.client.logger.log(f"Virtualenv path {self.venv_path}", "debug")
+        if self._debug_enabled:
+            self.client.logger.log(f"Virtualenv path {self.venv_path}", "debug")
         self.scripts_path: pathlib.Path = self.config_path / "scripts"
-        self.client.logger.log(f"Scripts path {self.scripts_path}", "debug")
+        if self._debug_enabled:
+            self.client.logger.log(f"Scripts path {self.scripts_path}", "debug")
         self.sierra_env_path: pathlib.Path = self.config_path
-        self.client.logger.log(
-            f"Sierra env path {self.sierra_env_path}", "debug"
-        )
+        if self._debug_enabled:
+            self.client.logger.log(
+                f"Sierra env path {self.sierra_env_path}", "debug"
+            )
         self.invokers_path: pathlib.Path = self.sierra_env_path / "invokers"
-        self.client.logger.log(f"Invokers path {self.invokers_path}", "debug")
-        self.os_type: str = platform.system().lower()
-        self.client.logger.log(f"OS type {self.os_type}", "debug")
+        if self._debug_enabled:
+            self.client.logger.log(f"Invokers path {self.invokers_path}", "debug")
+        if self._debug_enabled:
+            self.client.logger.log(f"Platform {sys.platform}", "debug")
+        self._venv_bin: pathlib.Path = self.venv_path / (
+            "Scripts" if _IS_WINDOWS else "bin"
+        )
+        self._exe_suffix: str = ".exe" if _IS_WINDOWS else ""
+        self._activate_cmd: str = (
+            f"{self.venv_path}\\Scripts\\activate.bat (CMD)\n"
+            f"{self.venv_path}\\Scripts\\Activate.ps1 (PowerShell)"
+            if _IS_WINDOWS
+            else f"source {self.venv_path}/bin/activate"
+        )
+
+        self._venv_executables: typing.Optional[dict[str, pathlib.Path]] = None
+        # The venv is built lazily, on the first call that needs it. A bare
+        # or half-built directory lacks pyvenv.cfg or the interpreter and
+        # is completed by _ensure_venv.
+        self._venv_ready: bool = os.path.isfile(
+            self.venv_path / "pyvenv.cfg"
+        ) and os.path.isfile(
+            _venv_executable(self._venv_bin, "python", self._exe_suffix)
+        )
 
         super().__init__(client)
-        self.client.logger.log("Completed environment __init__", "debug")
+        if self._debug_enabled:
+            self.client.logger.log("Completed environment __init__", "debug")
 
     def init(self) -> None:
         """
         Initialize the environment.
 
-        Logs each step to the client's logger.
+        Creates the directory layout and its files. The virtualenv is not
+        built here; it is created on first use by ``_ensure_venv``.
+
+        Raises
+        ------
+        SierraPathError
+            If the environment path exists but is not a directory.
+        SierraExecutionError
+            If a directory or file cannot be created.
         """
         self.client.logger.log("Initializing environment", "info")
-        if self.config_path.exists():
+        self._venv_executables = None
+
+        # One stat up front decides how the leaves below are created
+        try:
+            existed = stat.S_ISDIR(os.stat(self.config_path).st_mode)
+            if not existed:
+                raise sierra_internal_errors.SierraPathError(
+                    f"Environment path is not a directory: {self.config_path}"
+                )
+        except FileNotFoundError:
+            existed = False
+        if self._debug_enabled:
             self.client.logger.log(
-                "Config path exists, skipping creation", "warning"
+                f"Environment directory existed: {existed}", "debug"
             )
-        else:
-            self.client.logger.log("Creating config directory", "debug")
-            self.config_path.mkdir(parents=True, exist_ok=False)
 
-        self.client.logger.log("Creating scripts directory", "debug")
-        self._create_scripts_dir()
-
-        self.client.logger.log(
-            "Creating sierra environment directories", "debug"
-        )
-        self._create_sierra_env_dir()
+        # A fresh env needs config_path created along the way; an existing
+        # one only needs the leaves, which may already be there
+        for leaf in (self.scripts_path, self.invokers_path):
+            if self._debug_enabled:
+                self.client.logger.log(f"Creating directory {leaf}", "debug")
+            try:
+                leaf.mkdir(parents=not existed, exist_ok=existed)
+            except OSError as error:
+                self.client.logger.log(
+                    f"Error creating directory {leaf}: {error}", "error"
+                )
+                raise sierra_internal_errors.SierraExecutionError(
+                    f"Failed to create directory {leaf}: {error}"
+                ) from error
 
-        self.client.logger.log("Creating virtualenv", "debug")
-        self._create_virtualenv()
+        self._create_scripts_dir()
         self.client.logger.log("Environment initialization complete", "info")
 
     def _create_scripts_dir(self) -> None:
         """
-        Create the scripts directory for the environment.
+        Populate the environment root with its config and source files.
 
-        If the directory already exists, log a warning and return.
-        If the directory does not exist, create it and write the source file.
+        The directories themselves are created by ``init``. An existing
+        config.yaml is left untouched and the source file is (re)written.
         If an exception occurs, log the error and raise a SierraExecutionError.
         """
-        self.client.logger.log("Creating scripts directory", "debug")
         try:
-            self.scripts_path.mkdir(parents=False, exist_ok=True)
-            self.client.logger.log("Scripts directory created", "debug")
-            self.client.logger.log("Writing source file", "debug")
-            (self.config_path / "config.yaml").touch(exist_ok=True)
-            with (self.config_path / "source").open("w") as source_file:
-                source_file.write(
-                    "https://api.github.com/repos/xsyncio/sierra-source/contents\n"
+            if self._debug_enabled:
+                self.client.logger.log("Writing source file", "debug")
+            # Create config.yaml if missing without truncating an existing one
+            os.close(
+                os.open(
+                    self.config_path / "config.yaml",
+                    os.O_WRONLY | os.O_CREAT,
+                    0o644,
                 )
-            self.client.logger.log("Source file written", "debug")
+            )
+            fd = os.open(
+                self.config_path / "source",
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                0o644,
+            )
+            try:
+                os.write(fd, _DEFAULT_SOURCE)
+            finally:
+                os.close(fd)
+            if self._debug_enabled:
+                self.client.logger.log("Source file written", "debug")
         except Exception as error:
             self.client.logger.log(
-                f"Error creating scripts directory: {error}", "error"
+                f"Error writing environment files: {error}", "error"
             )
             raise sierra_internal_errors.SierraExecutionError(
-                f"Failed to create scripts directory: {error}"
-            )
+                f"Failed to write environment files: {error}"
+            ) from error
 
-    def _create_sierra_env_dir(self) -> None:
+    def _ensure_venv(self) -> None:
         """
-        Create the sierra environment directory.
+        Create the virtualenv if it has not been built yet.
 
-        Logs each step to the client's logger.
-        If the directory already exists, log a warning and return.
-        If the directory does not exist, create it and its subdirectories.
-        If an exception occurs, log the error and raise a SierraExecutionError.
+        Raises
+        ------
+        SierraExecutionError
+            If the virtualenv creation fails.
         """
-        self.client.logger.log(
-            "Creating sierra environment directory", "debug"
-        )
-        try:
-            self.sierra_env_path.mkdir(parents=False, exist_ok=True)
-            self.client.logger.log(
-                "Sierra environment directory created", "debug"
-            )
-            self.invokers_path.mkdir(parents=False, exist_ok=True)
-            self.client.logger.log("Invokers directory created", "debug")
-        except Exception as error:
-            self.client.logger.log(
-                f"Error creating sierra environment directory: {error}",
-                "error",
-            )
-            raise sierra_internal_errors.SierraExecutionError(
-                "Failed to create sierra environment directory: %s" % error
-            )
+        if self._venv_ready:
+            return
+        if self._debug_enabled:
+            self.client.logger.log("Creating virtualenv on first use", "debug")
+        self._create_virtualenv()
+        self._venv_ready = True
+        self._venv_executables = None
 
     def _create_virtualenv(self) -> None:
         """
         Create the virtualenv for the environment.
 
+        The venv is built in-process with ``venv.EnvBuilder``. On Windows a
+        failed in-process build is retried with ``python -m venv``.
+
         Raises
         ------
         SierraExecutionError
             If the virtualenv creation fails.
         """
-        self.client.logger.log("Starting venv creation", "debug")
+        # Deferred: venv and subprocess are only needed when building an env
+        import subprocess
+        import venv
+
+        if self._debug_enabled:
+            self.client.logger.log("Starting venv creation", "debug")
+        try:
+            # In-process creation avoids starting a second interpreter
+            venv.EnvBuilder(
+                with_pip=True, symlinks=not _IS_WINDOWS
+            ).create(
+                str(self.venv_path)
+            )
+            if self._debug_enabled:
+                self.client.logger.log("Virtualenv created", "debug")
+            return
+        except Exception as error:
+            if not _IS_WINDOWS:
+                self.client.logger.log(
+                    f"Error creating virtualenv: {error}", "error"
+                )
+                raise sierra_internal_errors.SierraExecutionError(
+                    f"Failed to create virtualenv: {error}"
+                ) from error
+            # Copy-based venvs can fail in-process on Windows; retry out of process
+            self.client.logger.log(
+                f"In-process venv creation failed ({error}), "
+                "falling back to subprocess",
+                "warning",
+            )
+
         try:
             subprocess.run(
                 [sys.executable, "-m", "venv", str(self.venv_path)],
                 check=True,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
             )
-            self.client.logger.log("Virtualenv created", "debug")
+            if self._debug_enabled:
+                self.client.logger.log("Virtualenv created", "debug")
         except subprocess.CalledProcessError as error:
+            stderr = error.stderr.decode("utf-8", errors="replace")
             self.client.logger.log(
-                "Error creating virtualenv: %s" % error.stderr.decode("utf-8"),
-                "error",
+                "Error creating virtualenv: %s" % stderr, "error"
             )
             raise sierra_internal_errors.SierraExecutionError(
-                "Failed to create virtualenv: %s"
-                % error.stderr.decode("utf-8")
-            )
+                "Failed to create virtualenv: %s" % stderr
+            ) from error
 
     def destroy(self) -> None:
         """
@@ -191,22 +371,21 @@ class SierraDevelopmentEnvironment(sierra_core_base.SierraCoreObject):
             If the directory removal fails.
         """
         self.client.logger.log("destroy: Removing environment", "info")
-        if self.config_path.exists():
-            self.client.logger.log(
-                "destroy: Environment directory exists", "debug"
-            )
-            try:
-                shutil.rmtree(self.config_path)
+        self._venv_ready = False
+        self._venv_executables = None
+        try:
+            _fast_rmtree(self.config_path)
+            if self._debug_enabled:
                 self.client.logger.log("destroy: Environment removed", "debug")
-            except OSError as error:
-                self.client.logger.log(
-                    "destroy: Error removing environment", "error"
-                )
-                raise error
-        else:
+        except FileNotFoundError:
             self.client.logger.log(
                 "destroy: Environment directory does not exist", "warning"
             )
+        except OSError as error:
+            self.client.logger.log(
+                "destroy: Error removing environment", "error"
+            )
+            raise error
 
     def exists(self) -> bool:
         """
@@ -217,9 +396,11 @@ class SierraDevelopmentEnvironment(sierra_core_base.SierraCoreObject):
         bool
             True if the directory exists.
         """
-        self.client.logger.log("exists: Checking directory existence", "debug")
+        if self._debug_enabled:
+            self.client.logger.log("exists: Checking directory existence", "debug")
         result = self.config_path.exists()
-        self.client.logger.log("exists: Result: %s" % result, "debug")
+        if self._debug_enabled:
+            self.client.logger.log("exists: Result: %s" % result, "debug")
         return result
 
     def list_contents(self) -> typing.List[str]:
@@ -239,18 +420,22 @@ class SierraDevelopmentEnvironment(sierra_core_base.SierraCoreObject):
         self.client.logger.log(
             "list_contents: Listing config directory contents", "info"
         )
-        if not self.config_path.exists():
+        if self._debug_enabled:
+            self.client.logger.log(
+                "list_contents: Iterating over directory entries", "debug"
+            )
+        try:
+            with os.scandir(self.config_path) as entries:
+                contents = [entry.name for entry in entries]
+        except FileNotFoundError as error:
             self.client.logger.log("list_contents: Path not found", "error")
             raise sierra_internal_errors.SierraPathError(
                 f"Cannot list contents of non-existent directory: {self.config_path}"
+            ) from error
+        if self._debug_enabled:
+            self.client.logger.log(
+                f"list_contents: Found entries {contents}", "debug"
             )
-        self.client.logger.log(
-            "list_contents: Iterating over directory entries", "debug"
-        )
-        contents = [entry.name for entry in self.config_path.iterdir()]
-        self.client.logger.log(
-            f"list_contents: Found entries {contents}", "debug"
-        )
         return contents
 
     def install_dependencies(
@@ -259,6 +444,9 @@ class SierraDevelopmentEnvironment(sierra_core_base.SierraCoreObject):
         """
         Install dependencies from a requirements file into the virtual environment.
 
+        Uses ``uv pip install`` when ``uv`` is on PATH and falls back to the
+        venv's own pip otherwise.
+
         Parameters
         ----------
         requirements_file : pathlib.Path, optional
@@ -278,32 +466,83 @@ class SierraDevelopmentEnvironment(sierra_core_base.SierraCoreObject):
             )
             return
 
-        pip_path: pathlib.Path = self._get_venv_executable("pip")
-        self.client.logger.log(f"Pip executable path: {pip_path}", "debug")
-        if not pip_path.exists():
+        self._ensure_venv()
+
+        import subprocess
+
+        uv_path = _find_uv()
+        if uv_path is not None:
+            # uv resolves and installs in parallel; target the venv's python
+            python_path = self._get_venv_executable("python")
+            if self._debug_enabled:
+                self.client.logger.log(
+                    f"Installing with uv ({uv_path}) into {python_path}",
+                    "debug",
+                )
+            cmd = [
+                uv_path,
+                "pip",
+                "install",
+                "--python",
+                str(python_path),
+                "-r",
+                str(requirements_file),
+            ]
+        else:
+            pip_path: pathlib.Path = self._get_venv_executable("pip")
+            if self._debug_enabled:
+                self.client.logger.log(
+                    f"Pip executable path: {pip_path}", "debug"
+                )
+            cmd = [
+                str(pip_path),
+                "install",
+                "--no-compile",
+                "--no-input",
+                "--disable-pip-version-check",
+                "-r",
+                str(requirements_file),
+            ]
+
+        # Stream the installer's output line by line so progress reaches the
+        # debug log as it happens; only the tail is kept for the error message
+        tail: collections.deque[str] = collections.deque(maxlen=50)
+        try:
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+            ) as proc:
+                for line in typing.cast(typing.IO[str], proc.stdout):
+                    line = line.rstrip()
+                    tail.append(line)
+                    if self._debug_enabled:
+                        self.client.logger.log(line, "debug")
+                returncode = proc.wait()
+        except FileNotFoundError as error:
             self.client.logger.log(
                 "Pip not found in virtual environment", "error"
             )
             raise sierra_internal_errors.SierraExecutionError(
                 "pip not found in virtual environment."
-            )
+            ) from error
 
-        try:
-            subprocess.run(
-                [str(pip_path), "install", "-r", str(requirements_file)],
-                check=True,
-                capture_output=True,
-            )
+        if returncode == 0:
             self.client.logger.log(
                 "Dependencies installed successfully", "info"
             )
-        except subprocess.CalledProcessError as error:
+        else:
+            output = "\n".join(tail)
             self.client.logger.log(
-                f"Error during dependency installation: {error.stderr.decode('utf-8')}",
+                f"Error during dependency installation: {output}",
                 "error",
             )
             raise sierra_internal_errors.SierraExecutionError(
-                f"Failed to install dependencies: {error.stderr.decode('utf-8')}"
+                f"Failed to install dependencies: {output}"
             )
 
     def activate_instructions(self) -> str:
@@ -321,19 +560,11 @@ class SierraDevelopmentEnvironment(sierra_core_base.SierraCoreObject):
         on both Windows and Unix-like systems.
         """
         self.client.logger.log("Generating activation command", "info")
-        if "windows" in self.os_type:
-            cmd = (
-                f"{self.venv_path}\\Scripts\\activate.bat (CMD)\n"
-                f"{self.venv_path}\\Scripts\\Activate.ps1 (PowerShell)"
-            )
+        if self._debug_enabled:
             self.client.logger.log(
-                f"Windows activation command: {cmd}", "debug"
+                f"Activation command: {self._activate_cmd}", "debug"
             )
-            return cmd
-
-        cmd = f"source {self.venv_path}/bin/activate"
-        self.client.logger.log(f"Unix activation command: {cmd}", "debug")
-        return cmd
+        return self._activate_cmd
 
     def _get_venv_executable(self, name: str) -> pathlib.Path:
         """
@@ -349,10 +580,31 @@ class SierraDevelopmentEnvironment(sierra_core_base.SierraCoreObject):
         pathlib.Path
             The path to the executable within the virtual environment.
         """
-        self.client.logger.log("Locating executable", "debug")
-        if "windows" in self.os_type:
-            path = self.venv_path / "Scripts" / f"{name}.exe"
-        else:
-            path = self.venv_path / "bin" / name
-        self.client.logger.log(f"Executable path: {path}", "debug")
-        return path
+        self._ensure_venv()
+        return _venv_executable(self._venv_bin, name, self._exe_suffix)
+
+    def _scan_venv_executables(self) -> dict[str, pathlib.Path]:
+        """
+        List the executables in the virtual environment's bin directory.
+
+        The directory is read with a single ``os.scandir`` call and the
+        result is cached until the environment is re-initialized or the
+        virtualenv is (re)built.
+
+        Returns
+        -------
+        dict[str, pathlib.Path]
+            Mapping of executable file names (e.g. ``python`` or
+            ``python.exe``) to their paths. Empty if the directory is missing.
+        """
+        self._ensure_venv()
+        if self._venv_executables is None:
+            bin_dir = self._venv_bin
+            try:
+                with os.scandir(bin_dir) as entries:
+                    self._venv_executables = {
+                        entry.name: bin_dir / entry.name for entry in entries
+                    }
+            except FileNotFoundError:
+                return {}
+        return self._venv_executables
@@ -1,5 +1,14 @@
+import concurrent.futures
+import json
 import pathlib
+import random
+import re
+import time
+import types
 import typing
+import urllib.parse
+
+import httpx
 
 import sierra.core.base as sierra_core_base
 import sierra.internal.errors as sierra_internal_errors
@@ -7,6 +16,145 @@ import sierra.internal.errors as sierra_internal_errors
 if typing.TYPE_CHECKING:
     import sierra.client as sierra_client
 
+# orjson is an optional speedup, see the "speedups" extra
+_orjson: typing.Optional[types.ModuleType] = None
+try:
+    import orjson as _orjson_module  # type: ignore[import-not-found]
+
+    _orjson = _orjson_module
+except ImportError:
+    pass
+
+
+# Default cap on in-flight requests during populate() and update()
+_MAX_DOWNLOAD_WORKERS: int = 8
+
+# Concurrent file writes in install_many(); small, to avoid disk thrashing
+_MAX_INSTALL_WORKERS: int = 4
+
+# Per-request timeouts, tighter than httpx's 5s default, so one stalled
+# mirror gives up its worker quickly instead of holding it
+_REQUEST_TIMEOUT = httpx.Timeout(4.0, connect=3.0)
+
+# How long a downloaded script stays cached before it must be refetched
+_SCRIPT_TTL: int = 7 * 24 * 3600
+
+# Lease for scripts pinned to a commit, whose content can never change
+_PINNED_SCRIPT_TTL: int = 30 * 24 * 3600
+
+# A full commit SHA as a path segment, e.g. raw.githubusercontent.com URLs
+_COMMIT_SEGMENT = re.compile(r"/[0-9a-f]{40}/")
+
+# Largest script accepted from a source
+_MAX_SCRIPT_BYTES: int = 10 * 1024 * 1024
+
+# Read size when streaming a script body
+_DOWNLOAD_CHUNK_BYTES: int = 1024 * 1024
+
+# Content types a raw script download may carry; anything else (notably
+# text/html error pages) is rejected before it reaches the cache
+_SCRIPT_CONTENT_TYPES: tuple[str, ...] = (
+    "text/plain",
+    "text/x-python",
+    "text/x-script.python",
+    "application/x-python",
+    "application/octet-stream",
+)
+
+# Longest pause (seconds) for a GitHub rate-limit reset before giving up
+_MAX_RATE_LIMIT_WAIT: float = 60.0
+
+# Listing entry fields read by _extract_targets; only these are cached
+_LISTING_FIELDS: tuple[str, ...] = ("type", "path", "download_url", "raw_url")
+
+# Retries for throttled (403/429 with Retry-After, 429) and 5xx responses
+_MAX_RETRIES: int = 3
+
+
+def _loads(data: bytes) -> typing.Any:
+    """
+    Parse a JSON document from raw bytes.
+
+    Uses ``orjson`` when it is installed and the standard library otherwise;
+    either way the body is parsed without first decoding it to ``str``.
+
+    Parameters
+    ----------
+    data : bytes
+        UTF-8 encoded JSON.
+
+    Returns
+    -------
+    Any
+        The parsed document.
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+class _Download(typing.NamedTuple):
+    """A script response whose body was read with a size cap."""
+
+    status_code: int
+    headers: httpx.Headers
+    content: bytes
+    # True if reading stopped at the cap, so ``content`` is incomplete
+    truncated: bool = False
+
+
+def _prune_listing(data: typing.Any) -> typing.Any:
+    """
+    Strip a source listing down to the fields populate() reads.
+
+    GitHub contents entries carry a dozen URLs, hashes and sizes per file;
+    caching only ``_LISTING_FIELDS`` keeps the stored listing small and
+    cheap to decompress when a ``304`` brings it back.
+
+    Parameters
+    ----------
+    data : Any
+        A parsed listing: a list of entries or a ``{"files": [...]}``
+        mapping. Anything else is returned unchanged.
+
+    Returns
+    -------
+    Any
+        The listing in the same shape with trimmed entries.
+    """
+
+    def prune(items: typing.Any) -> typing.Any:
+        if not isinstance(items, list):
+            return items
+        return [
+            {field: item[field] for field in _LISTING_FIELDS if field in item}
+            for item in items
+            if isinstance(item, dict)
+        ]
+
+    if isinstance(data, list):
+        return prune(data)
+    if isinstance(data, dict) and "files" in data:
+        return {"files": prune(data["files"])}
+    return data
+
+
+def _listing_cache_key(url: str) -> str:
+    """
+    Build the cache key under which a source's directory listing is kept.
+
+    Parameters
+    ----------
+    url : str
+        The source listing URL.
+
+    Returns
+    -------
+    str
+        Cache key, distinct from any script name.
+    """
+    return f"listing::{url}"
+
 
 class SierraSideloader(sierra_core_base.SierraCoreObject):
     """
@@ -17,10 +165,14 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
     ----------
     client : sierra_client.SierraDevelopmentClient
         A reference to the Sierra development client.
+    max_concurrency : int
+        Maximum number of requests in flight at once.
     """
 
     def __init__(
-        self, client: "sierra_client.SierraDevelopmentClient"
+        self,
+        client: "sierra_client.SierraDevelopmentClient",
+        max_concurrency: int = _MAX_DOWNLOAD_WORKERS,
     ) -> None:
         """
         Initialize the SierraSideloader.
@@ -29,6 +181,9 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
         ----------
         client : SierraDevelopmentClient
             A reference to the Sierra development client.
+        max_concurrency : int
+            Maximum number of requests in flight at once; keeps large
+            populates clear of GitHub's secondary rate limits.
 
         Raises
         ------
@@ -36,6 +191,9 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
             If the configuration path or source file does not exist.
         """
         self.client = client
+        self.max_concurrency: int = max_concurrency
+        # Cached so disabled debug lines skip building their f-strings
+        self._debug_enabled: bool = client.logger.is_enabled_for("debug")
         self.cache = self.client.cache
         self.path: pathlib.Path = self.client.environment.config_path
 
@@ -48,24 +206,249 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
             )
 
         source_path = self.path / "source"
-        if not source_path.exists():
+        try:
+            raw = source_path.read_bytes()
+        except FileNotFoundError as e:
             self.client.logger.log("Missing source file.", "error")
             raise sierra_internal_errors.SierraPathError(
                 f"File {source_path} does not exist."
-            )
+            ) from e
 
-        if source_path.stat().st_size == 0:
+        if not raw:
             self.client.logger.log("Source file is empty.", "warning")
 
-        with open(source_path, "r", encoding="utf-8") as f:
-            self.sources: list[str] = [
-                line.strip() for line in f if line.strip()
-            ]
+        # Split and strip in C on the raw bytes, decoding only kept lines;
+        # dict.fromkeys drops repeated entries but keeps their order
+        self.sources: list[str] = list(
+            dict.fromkeys(
+                stripped.decode("utf-8")
+                for stripped in (line.strip() for line in raw.splitlines())
+                if stripped
+            )
+        )
+        # Scheme-less entries default to https; resolved once, not per
+        # populate, and deduplicated again since "host/x" and
+        # "https://host/x" name the same listing
+        self._normalized_sources: list[str] = list(
+            dict.fromkeys(
+                source if source.startswith("http") else f"https://{source}"
+                for source in self.sources
+            )
+        )
+
+        if self._debug_enabled:
+            self.client.logger.log(
+                f"Loaded {len(self.sources)} sources from {source_path}.", "debug"
+            )
+        # Lifetime of downloaded scripts; ETag revalidation keeps it cheap
+        self.script_ttl: int = _SCRIPT_TTL
+        # Epoch time until which the GitHub API quota is known to be spent
+        self._api_blocked_until: float = 0.0
+        # Cached script names mapped to their case-folded form for search;
+        # built on first read, then extended with keys not yet seen
+        self._file_keys: typing.Optional[dict[str, str]] = None
+        # Cache keys already read and found not to hold a script
+        self._other_keys: set[str] = set()
+        # Set once install() has made sure the scripts directory exists
+        self._scripts_dir_ready: bool = False
+        super().__init__(client)
+
+    def _wait_for_api_quota(self, url: str) -> None:
+        """
+        Block until the GitHub API quota allows another request.
 
+        Parameters
+        ----------
+        url : str
+            The URL about to be requested, for error reporting.
+
+        Raises
+        ------
+        SierraHTTPError
+            If the quota resets further away than ``_MAX_RATE_LIMIT_WAIT``.
+        """
+        wait = self._api_blocked_until - time.time()
+        if wait <= 0:
+            return
+        if wait > _MAX_RATE_LIMIT_WAIT:
+            raise sierra_internal_errors.SierraHTTPError(
+                f"GitHub API rate limit exhausted, not fetching {url}; "
+                f"resets in {int(wait)}s"
+            )
         self.client.logger.log(
-            f"Loaded {len(self.sources)} sources from {source_path}.", "debug"
+            f"GitHub API rate limit reached, waiting {wait:.0f}s", "warning"
         )
-        super().__init__(client)
+        time.sleep(wait)
+
+    def _note_rate_limit(self, response: typing.Any) -> None:
+        """
+        Record GitHub's rate-limit state from a response's headers.
+
+        Parameters
+        ----------
+        response : httpx.Response
+            A response from the GitHub API.
+        """
+        headers = response.headers
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None and response.status_code in (403, 429):
+            try:
+                self._api_blocked_until = time.time() + float(retry_after)
+            except ValueError:
+                pass
+            return
+        if headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                self._api_blocked_until = float(
+                    headers.get("X-RateLimit-Reset", 0)
+                )
+            except ValueError:
+                pass
+
+    @staticmethod
+    def _retry_delay(
+        response: typing.Any, attempt: int
+    ) -> typing.Optional[float]:
+        """
+        Decide whether and how long to wait before retrying a response.
+
+        Parameters
+        ----------
+        response : httpx.Response
+            The response to inspect.
+        attempt : int
+            Number of retries already made for this request.
+
+        Returns
+        -------
+        float or None
+            Seconds to sleep (``Retry-After`` or exponential backoff, plus up
+            to one second of jitter), or None if the response is final.
+        """
+        status = response.status_code
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None and status in (403, 429):
+            try:
+                base = float(retry_after)
+            except ValueError:
+                base = float(2**attempt)
+        elif status == 429 or status >= 500:
+            base = float(min(60, 2**attempt))
+        else:
+            return None
+        if base > _MAX_RATE_LIMIT_WAIT:
+            return None
+        return base + random.uniform(0, 1)
+
+    def _stream_capped(
+        self,
+        url: str,
+        headers: typing.Optional[dict[str, str]],
+        max_bytes: int,
+    ) -> _Download:
+        """
+        GET ``url`` as a stream, reading at most ``max_bytes + 1`` bytes.
+
+        The body is read in ``_DOWNLOAD_CHUNK_BYTES`` chunks and reading stops
+        as soon as the cap is passed, or is skipped entirely when the
+        declared ``Content-Length`` is already over it; the size check in
+        ``_validate_script_response`` then rejects the download.
+
+        Parameters
+        ----------
+        url : str
+            The URL to fetch.
+        headers : dict[str, str], optional
+            Extra request headers.
+        max_bytes : int
+            Largest body that will be accepted.
+
+        Returns
+        -------
+        _Download
+            Status, headers and the body, flagged ``truncated`` if reading
+            stopped at the cap. The cap applies to the decoded body.
+        """
+        with self.client.http_client.stream(
+            "GET", url, headers=headers, timeout=_REQUEST_TIMEOUT
+        ) as response:
+            body = bytearray()
+            # A declared length over the cap is over it decoded as well
+            declared = response.headers.get("Content-Length", "")
+            truncated = declared.isdigit() and int(declared) > max_bytes
+            if not truncated:
+                for chunk in response.iter_bytes(_DOWNLOAD_CHUNK_BYTES):
+                    body += chunk
+                    if len(body) > max_bytes:
+                        truncated = True
+                        break
+            return _Download(
+                response.status_code, response.headers, bytes(body), truncated
+            )
+
+    def _get(
+        self,
+        url: str,
+        headers: typing.Optional[dict[str, str]] = None,
+        *,
+        api: bool = False,
+        max_bytes: typing.Optional[int] = None,
+    ) -> typing.Any:
+        """
+        GET ``url``, retrying throttled and server-error responses.
+
+        Parameters
+        ----------
+        url : str
+            The URL to fetch.
+        headers : dict[str, str], optional
+            Extra request headers.
+        api : bool
+            Whether ``url`` is a GitHub API endpoint whose rate-limit quota
+            should be tracked.
+        max_bytes : int, optional
+            If given, stream the body and stop reading past this size.
+
+        Returns
+        -------
+        httpx.Response
+            The first final response, or the last one once retries run out.
+
+        Raises
+        ------
+        SierraHTTPError
+            If the request times out or cannot connect, or if ``api`` is
+            set and the API quota is exhausted for too long.
+        """
+        attempt = 0
+        response: typing.Union[_Download, httpx.Response]
+        while True:
+            if api:
+                self._wait_for_api_quota(url)
+            try:
+                if max_bytes is not None:
+                    response = self._stream_capped(url, headers, max_bytes)
+                else:
+                    response = self.client.http_client.get(
+                        url, headers=headers, timeout=_REQUEST_TIMEOUT
+                    )
+            except httpx.HTTPError as e:
+                # Timeouts and connection errors fail only this request
+                raise sierra_internal_errors.SierraHTTPError(
+                    f"Request to {url} failed: {e}"
+                ) from e
+            if api:
+                self._note_rate_limit(response)
+            delay = self._retry_delay(response, attempt)
+            if delay is None or attempt >= _MAX_RETRIES:
+                return response
+            attempt += 1
+            self.client.logger.log(
+                f"{url} returned {response.status_code}, retry {attempt} "
+                f"of {_MAX_RETRIES} in {delay:.1f}s",
+                "warning",
+            )
+            time.sleep(delay)
 
     def _get_github_data(self, url: str) -> dict[str, typing.Any]:
         """
@@ -84,16 +467,35 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
         Raises
         ------
         SierraHTTPError
-            If the request to the GitHub API fails.
+            If the request to the GitHub API fails, or the API quota is
+            exhausted for longer than ``_MAX_RATE_LIMIT_WAIT``.
 
         Notes
         -----
-        This function logs each step of the data-fetching process.
+        This function logs each step of the data-fetching process. Listings
+        are cached with their ETag and revalidated with ``If-None-Match``;
+        GitHub does not count ``304`` replies against the quota. GitHub's
+        ``X-RateLimit-*`` and ``Retry-After`` headers are tracked so that
+        requests are not sent while the quota is known to be spent.
         """
-        self.client.logger.log(
-            f"Fetching data from GitHub API: {url}", "debug"
-        )
-        response = self.client.http_client.get(url)
+        if self._debug_enabled:
+            self.client.logger.log(
+                f"Fetching data from GitHub API: {url}", "debug"
+            )
+        # A stored ETag turns an unchanged listing into a bodiless 304
+        cache_key = _listing_cache_key(url)
+        cached = self.cache.get(cache_key)
+        cached_data: typing.Optional[dict[str, typing.Any]] = None
+        headers: typing.Optional[dict[str, str]] = None
+        if isinstance(cached, dict) and cached.get("etag"):
+            cached_data = cached["data"]
+            headers = {"If-None-Match": cached["etag"]}
+
+        response = self._get(url, headers=headers, api=True)
+        if response.status_code == 304 and cached_data is not None:
+            if self._debug_enabled:
+                self.client.logger.log(f"Listing unchanged: {url}", "debug")
+            return cached_data
         if response.status_code != 200:
             self.client.logger.log(
                 f"Failed to fetch data from GitHub: {url}, Status Code: {response.status_code}",
@@ -104,9 +506,47 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
             )
 
         self.client.logger.log("GitHub data fetched successfully", "info")
-        return typing.cast("dict[str, typing.Any]", response.json())
+        data: dict[str, typing.Any] = _loads(response.content)
+        etag = response.headers.get("ETag")
+        if etag:
+            self.cache.set(
+                key=cache_key,
+                value={
+                    "type": "listing",
+                    "etag": etag,
+                    "data": _prune_listing(data),
+                },
+                persist=True,
+                compress=True,
+            )
+        return data
+
+    def _ttl_for(self, url: str) -> int:
+        """
+        Choose how long a script downloaded from ``url`` stays cached.
+
+        Parameters
+        ----------
+        url : str
+            The script's download URL.
 
-    def _download_and_cache(self, name: str, url: str) -> None:
+        Returns
+        -------
+        int
+            ``_PINNED_SCRIPT_TTL`` for URLs pinned to a commit SHA, otherwise
+            ``self.script_ttl``.
+        """
+        if _COMMIT_SEGMENT.search(url):
+            return _PINNED_SCRIPT_TTL
+        return self.script_ttl
+
+    def _download_and_cache(
+        self,
+        name: str,
+        url: str,
+        ttl: typing.Optional[int] = None,
+        aliases: typing.Sequence[str] = (),
+    ) -> None:
         """
         Download a Python file and cache it using the new CacheManager.
 
@@ -116,6 +556,10 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
             The name of the file to cache.
         url : str
             The URL to download the file from.
+        ttl : int, optional
+            Cache lifetime in seconds; chosen by ``_ttl_for`` if omitted.
+        aliases : Sequence[str]
+            Further names to cache the same download under.
 
         Raises
         ------
@@ -125,7 +569,7 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
         self.client.logger.log(
             f"Downloading .py file: {name} from {url}", "info"
         )
-        response = self.client.http_client.get(url)
+        response = self._get(url, max_bytes=_MAX_SCRIPT_BYTES)
         if response.status_code != 200:
             self.client.logger.log(
                 f"Failed to download {url}: {response.status_code}", "error"
@@ -133,27 +577,330 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
             raise sierra_internal_errors.SierraHTTPError(
                 f"Failed to download {url}: {response.status_code}"
             )
+        self._validate_script_response(url, response)
+        self._cache_response(name, url, response, ttl)
+        for alias in aliases:
+            self._cache_response(alias, url, response, ttl)
+
+    def _validate_script_response(self, url: str, response: typing.Any) -> None:
+        """
+        Reject downloads that cannot be a Python script.
+
+        Parameters
+        ----------
+        url : str
+            The URL the response came from.
+        response : httpx.Response
+            A ``200`` response for `url`.
 
-        # Use new CacheManager interface with proper typing
+        Raises
+        ------
+        SierraHTTPError
+            If the content type is not a script type, the body exceeds
+            ``_MAX_SCRIPT_BYTES``, or the body is a GitHub JSON error.
+        """
+        reason: typing.Optional[str] = None
+        content_type = response.headers.get("Content-Type", "")
+        media_type = content_type.split(";", 1)[0].strip().lower()
+        if media_type and media_type not in _SCRIPT_CONTENT_TYPES:
+            reason = f"unexpected content type {media_type!r}"
+        else:
+            # Content-Length is the encoded size; it only bounds the decoded
+            # body when the response is not compressed
+            declared = response.headers.get("Content-Length", "")
+            if (
+                not response.headers.get("Content-Encoding")
+                and declared.isdigit()
+                and int(declared) > _MAX_SCRIPT_BYTES
+            ):
+                reason = f"{declared} bytes exceeds {_MAX_SCRIPT_BYTES}"
+            elif getattr(response, "truncated", False):
+                # Streaming stopped at the cap; the body is incomplete
+                reason = f"body exceeds {_MAX_SCRIPT_BYTES} bytes"
+            elif len(response.content) > _MAX_SCRIPT_BYTES:
+                reason = (
+                    f"{len(response.content)} bytes exceeds {_MAX_SCRIPT_BYTES}"
+                )
+            elif response.content.lstrip().startswith(b'{"message"'):
+                reason = "body is a GitHub API error"
+        if reason is not None:
+            self.client.logger.log(
+                f"Rejected download {url}: {reason}", "error"
+            )
+            raise sierra_internal_errors.SierraHTTPError(
+                f"Rejected download {url}: {reason}"
+            )
+
+    def _cache_response(
+        self,
+        name: str,
+        url: str,
+        response: typing.Any,
+        ttl: typing.Optional[int] = None,
+    ) -> None:
+        """
+        Store a downloaded script together with its validators.
+
+        Parameters
+        ----------
+        name : str
+            The name of the file to cache.
+        url : str
+            The URL the file was downloaded from.
+        response : httpx.Response
+            The successful response for `url`.
+        ttl : int, optional
+            Cache lifetime in seconds; chosen by ``_ttl_for`` if omitted.
+
+        Raises
+        ------
+        SierraHTTPError
+            If the body is not valid UTF-8.
+        """
+        # Python sources are UTF-8 (PEP 3120), so decode the body directly
+        # rather than through the response's charset detection. Strictly,
+        # so the cached text re-encodes to exactly the downloaded bytes.
+        try:
+            content = response.content.decode("utf-8")
+        except UnicodeDecodeError as e:
+            self.client.logger.log(
+                f"Rejected download {url}: body is not valid UTF-8", "error"
+            )
+            raise sierra_internal_errors.SierraHTTPError(
+                f"Rejected download {url}: body is not valid UTF-8"
+            ) from e
+
+        # ETag / Last-Modified let update() revalidate instead of refetching
         cache_data: dict[str, typing.Any] = {
-            "content": response.text,
+            "content": content,
+            "encoding": "utf-8",
+            "content_length": len(response.content),
             "type": "file",
             "source": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
         }
 
-        # Store with compression and persistence enabled, using TTL of 7 days
+        # Store with compression and persistence enabled
         self.cache.set(
             key=name,
             value=cache_data,
-            ttl=7 * 24 * 3600,  # 7 days in seconds
+            ttl=ttl if ttl is not None else self._ttl_for(url),
             persist=True,
             compress=True,
         )
 
+        if self._file_keys is not None:
+            self._file_keys[name] = name.casefold()
         self.client.logger.log(f"Cached '{name}' successfully", "info")
 
+    def _unchanged_by_head(
+        self, name: str, url: str, entry: dict[str, typing.Any]
+    ) -> bool:
+        """
+        Check with a ``HEAD`` whether a script without validators changed.
+
+        Only used for entries cached without ETag or Last-Modified. If the
+        server now sends either, a full GET is needed to record them, so the
+        entry counts as changed; otherwise equal ``Content-Length`` counts as
+        unchanged. A ``Content-Encoding`` makes the length that of the
+        encoded body, which cannot be compared with the decoded size cached,
+        so such entries count as changed too.
+
+        Parameters
+        ----------
+        name : str
+            The name of the cached file.
+        url : str
+            The entry's source URL.
+        entry : dict[str, typing.Any]
+            The cached entry.
+
+        Returns
+        -------
+        bool
+            True if the cached content can be kept.
+        """
+        cached_length = entry.get("content_length")
+        if cached_length is None:
+            return False
+        try:
+            response = self.client.http_client.head(
+                url, timeout=_REQUEST_TIMEOUT
+            )
+        except httpx.HTTPError:
+            return False
+        headers = response.headers
+        if (
+            response.status_code != 200
+            or headers.get("ETag")
+            or headers.get("Last-Modified")
+            or headers.get("Content-Encoding")
+        ):
+            return False
+        unchanged: bool = headers.get("Content-Length") == str(cached_length)
+        if self._debug_enabled and unchanged:
+            self.client.logger.log(
+                f"'{name}' unchanged by size, skipping download", "debug"
+            )
+        return unchanged
+
+    def _refresh(self, name: str) -> bool:
+        """
+        Revalidate a cached script against its source with a conditional GET.
+
+        A ``304 Not Modified`` only renews the entry's TTL; any other success
+        replaces the cached content. Entries without validators are checked
+        with a ``HEAD`` first.
+
+        Parameters
+        ----------
+        name : str
+            The name of the cached file.
+
+        Returns
+        -------
+        bool
+            True if new content was downloaded, False if the entry was
+            unchanged or is not a downloaded file.
+
+        Raises
+        ------
+        SierraHTTPError
+            If the request to the entry's source fails.
+        """
+        # Revalidation is maintenance, not use; keep access stats intact
+        entry = self.cache.get(name, peek=True)
+        if not isinstance(entry, dict) or entry.get("type") != "file":
+            return False
+        url: typing.Optional[str] = entry.get("source")
+        if not url:
+            return False
+
+        headers: dict[str, str] = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        if not headers:
+            if self._unchanged_by_head(name, url, entry):
+                self.cache.touch(name, ttl=self._ttl_for(url))
+                return False
+            self._download_and_cache(name=name, url=url)
+            return True
+
+        if self._debug_enabled:
+            self.client.logger.log(f"Revalidating '{name}' from {url}", "debug")
+        response = self._get(
+            url, headers=headers, max_bytes=_MAX_SCRIPT_BYTES
+        )
+        if response.status_code == 304:
+            self.cache.touch(name, ttl=self._ttl_for(url))
+            if self._debug_enabled:
+                self.client.logger.log(f"'{name}' is up to date", "debug")
+            return False
+        if response.status_code != 200:
+            self.client.logger.log(
+                f"Failed to revalidate {url}: {response.status_code}", "error"
+            )
+            raise sierra_internal_errors.SierraHTTPError(
+                f"Failed to download {url}: {response.status_code}"
+            )
+        self._validate_script_response(url, response)
+        self._cache_response(name, url, response)
+        return True
+
+    @staticmethod
+    def _extract_targets(
+        data: typing.Any,
+    ) -> typing.Iterator[tuple[str, str]]:
+        """
+        Yield the ``.py`` files of a source listing as ``(name, url)`` pairs.
+
+        Accepts both a plain list of entries and a ``{"files": [...]}``
+        mapping. Entries that are not files, not ``.py``, or lack a
+        ``download_url``/``raw_url`` are skipped.
+
+        Parameters
+        ----------
+        data : Any
+            A parsed source listing.
+
+        Yields
+        ------
+        tuple[str, str]
+            Script name (file stem) and download URL.
+        """
+        files = data if isinstance(data, list) else data.get("files", [])
+        for item in files:
+            if not isinstance(item, dict) or item.get("type") != "file":
+                continue
+            path = item.get("path")
+            if not isinstance(path, str) or not path.endswith(".py"):
+                continue
+            url = item.get("download_url") or item.get("raw_url")
+            # Basename minus ".py" by slicing; no PurePath per entry
+            name = path.rpartition("/")[2][:-3]
+            if url and name:
+                yield name, url
+
+    def _fetch_listing(self, source: str) -> typing.Optional[typing.Any]:
+        """
+        Fetch one source listing, logging and swallowing HTTP failures.
+
+        Parameters
+        ----------
+        source : str
+            The normalized source URL.
+
+        Returns
+        -------
+        Any or None
+            The parsed listing, or None if the source could not be fetched.
+        """
+        if self._debug_enabled:
+            self.client.logger.log(f"Processing source: {source}", "debug")
+        try:
+            return self._get_github_data(source)
+        except sierra_internal_errors.SierraHTTPError as e:
+            self.client.logger.log(
+                f"Skipping source due to error: {e}", "warning"
+            )
+            return None
+
+    def _fetch_listings(self) -> list[typing.Any]:
+        """
+        Fetch every source listing, up to ``max_concurrency`` at a time.
+
+        GitHub's rate limit is shared by all workers through
+        ``_wait_for_api_quota``, so once it is spent the listings not yet
+        started are skipped without a request.
+
+        Returns
+        -------
+        list[Any]
+            Parsed listings in source order, so the first source listing a
+            name still wins; sources that failed are left out.
+        """
+        sources = self._normalized_sources
+        if len(sources) <= 1 or self.max_concurrency <= 1:
+            listings = [self._fetch_listing(source) for source in sources]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(sources))
+            ) as executor:
+                # map() keeps source order; list() re-raises anything
+                # unexpected from a worker
+                listings = list(executor.map(self._fetch_listing, sources))
+        return [data for data in listings if data is not None]
+
     def populate(self) -> None:
-        """Pulls new files from all sources and caches all valid `.py` scripts."""
+        """
+        Pulls new files from all sources and caches all valid `.py` scripts.
+
+        Source listings are fetched concurrently first; the collected
+        scripts are then downloaded concurrently on a thread pool.
+        """
         self.client.logger.log("Starting population from sources...", "info")
 
         # Check if sources list is empty and handle gracefully
@@ -162,83 +909,70 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
                 "No sources configured. Nothing to populate.", "warning"
             )
             return
+        self._populate(self._fetch_listings())
 
+    def _populate(self, listings: list[typing.Any]) -> None:
+        """
+        Cache the scripts of already fetched listings that are not cached yet.
+
+        Parameters
+        ----------
+        listings : list[Any]
+            Parsed source listings, as returned by ``_fetch_listings``.
+        """
         total_cached = 0
         total_skipped = 0
-
-        for source in self.sources:
-            if not source.startswith("http"):
-                source = f"https://{source}"
-
-            self.client.logger.log(f"Processing source: {source}", "debug")
-
-            try:
-                data = self._get_github_data(source)
-            except sierra_internal_errors.SierraHTTPError as e:
-                self.client.logger.log(
-                    f"Skipping source due to error: {e}", "warning"
-                )
-                continue
-
-            # Handle both direct file lists and nested file structures
-            files = data if isinstance(data, list) else data.get("files", [])
-            files = typing.cast("list[typing.Any]", files)
-
-            for file_item in files:
-                # Check if file is a dictionary (expected format)
-                if not isinstance(file_item, dict):
-                    self.client.logger.log(
-                        f"Skipping unexpected file format: {file_item}",
-                        "warning",
-                    )
+        # Download URL -> names to cache it under, so mirrors listing the
+        # same file cost one request
+        targets: dict[str, list[str]] = {}
+        # Names already cached, plus names queued as this run goes; one
+        # query up front instead of a cache lookup per listed file. Adding
+        # queued names means the first source listing a name wins.
+        seen = set(self.cache.keys(include_expired=False))
+
+        # Bound once; this loop runs for every file of every listing
+        extract = self._extract_targets
+        debug = self._debug_enabled
+        log = self.client.logger.log
+        mark_seen = seen.add
+        for data in listings:
+            for name, url in extract(data):
+                if name in seen:
+                    if debug:
+                        log(f"Skipping '{name}' as it is already cached", "debug")
+                    total_skipped += 1
                     continue
-
-                file_dict = typing.cast("dict[str, typing.Any]", file_item)
-
-                if file_dict.get("type") == "file":
-                    file_path_str = file_dict.get("path")
-                    if not file_path_str:
+                mark_seen(name)
+                targets.setdefault(url, []).append(name)
+
+        # Downloads are I/O-bound; overlap them on the shared HTTP client
+        if targets:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(targets))
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        self._download_and_cache,
+                        name=names[0],
+                        url=url,
+                        aliases=names[1:],
+                    ): names
+                    # Submit grouped by host so pooled connections are reused
+                    for url, names in sorted(
+                        targets.items(),
+                        key=lambda item: urllib.parse.urlsplit(item[0]).netloc,
+                    )
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    names = futures[future]
+                    try:
+                        future.result()
+                        total_cached += len(names)
+                    except sierra_internal_errors.SierraHTTPError as e:
                         self.client.logger.log(
-                            f"Skipping file without path: {file_dict}",
-                            "warning",
+                            f"Failed to cache {', '.join(names)}: {e}",
+                            "error",
                         )
-                        continue
-
-                    # Convert to pathlib.Path for proper path handling
-                    file_path = pathlib.Path(typing.cast("str", file_path_str))
-
-                    if file_path.suffix == ".py":
-                        name = file_path.stem
-
-                        # Check if already cached using the new CacheManager exists method
-                        if self.cache.exists(name):
-                            self.client.logger.log(
-                                f"Skipping '{name}' as it is already cached",
-                                "debug",
-                            )
-                            total_skipped += 1
-                            continue
-
-                        # Try to get download URL with fallback to raw_url
-                        url_raw = file_dict.get(
-                            "download_url"
-                        ) or file_dict.get("raw_url")
-                        if not url_raw:
-                            self.client.logger.log(
-                                f"Skipping file without raw/download URL: {file_dict}",
-                                "warning",
-                            )
-                            continue
-
-                        url = typing.cast("str", url_raw)
-
-                        try:
-                            self._download_and_cache(name=name, url=url)
-                            total_cached += 1
-                        except sierra_internal_errors.SierraHTTPError as e:
-                            self.client.logger.log(
-                                f"Failed to cache {name}: {e}", "error"
-                            )
 
         self.client.logger.log(
             f"Population complete: {total_cached} .py files cached, {total_skipped} skipped (already cached)",
@@ -246,12 +980,62 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
         )
 
     def update(self) -> None:
-        """Refreshes the sideloader by pulling from all sources again."""
+        """
+        Refreshes the sideloader by pulling from all sources again.
+
+        Cached scripts no longer listed by any source are removed. The rest
+        are revalidated with conditional GETs, so unchanged files cost one
+        ``304`` round trip; sources are then re-populated to pick up new
+        files.
+        """
         self.client.logger.log("Updating sideloader sources...", "info")
-        self.client.logger.log("Clearing cache for update...", "debug")
-        self.cache.clear()
+        listings = self._fetch_listings() if self.sources else []
+        names = self._live_file_keys()
+        if len(listings) == len(self._normalized_sources):
+            listed = {
+                name for data in listings for name, _ in self._extract_targets(data)
+            }
+            removed = [name for name in names if name not in listed]
+            if removed:
+                self.cache.delete_many(removed)
+                self.client.logger.log(
+                    f"Removed {len(removed)} scripts no longer listed", "info"
+                )
+                names = [name for name in names if name in listed]
+        else:
+            # A listing is missing, so absence proves nothing; keep all
+            self.client.logger.log(
+                "Not every source could be listed; keeping cached scripts",
+                "warning",
+            )
+        refreshed = 0
+        if names:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(names))
+            ) as executor:
+                futures = {
+                    executor.submit(self._refresh, name): name
+                    for name in names
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        refreshed += future.result()
+                    except sierra_internal_errors.SierraHTTPError as e:
+                        self.client.logger.log(
+                            f"Failed to refresh {futures[future]}: {e}",
+                            "warning",
+                        )
+        self.client.logger.log(
+            f"Revalidated {len(names)} cached scripts, {refreshed} changed",
+            "info",
+        )
+        if not self.sources:
+            self.client.logger.log(
+                "No sources configured. Nothing to populate.", "warning"
+            )
+            return
         self.client.logger.log("Populating sideloader sources...", "info")
-        self.populate()
+        self._populate(listings)
 
     def install(self, name: str) -> None:
         """
@@ -279,8 +1063,7 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
                 f"No cached package named '{name}' found."
             )
 
-        # Type cast the cache entry to expected format
-        entry = typing.cast("dict[str, typing.Any]", entry_raw)
+        entry: dict[str, typing.Any] = entry_raw
 
         # Validate that it's a file entry
         if entry.get("type") != "file":
@@ -302,21 +1085,55 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
                 f"Cached file '{name}' has no content."
             )
 
-        content_str = typing.cast("str", content)
+        content_str: str = content
 
         script_dir = self.client.environment.scripts_path
-        if not script_dir.exists():
-            self.client.logger.log(
-                f"Script path missing: {script_dir}, creating it.", "debug"
-            )
+        if not self._scripts_dir_ready:
+            # Idempotent, and only done once per sideloader
             script_dir.mkdir(parents=True, exist_ok=True)
+            self._scripts_dir_ready = True
 
         script_path = script_dir / f"{name}.py"
-        with open(script_path, "w", encoding="utf-8") as f:
-            f.write(content_str)
+        # Cached content was decoded strictly, so this reproduces the
+        # downloaded bytes exactly, with no newline translation
+        script_path.write_bytes(content_str.encode("utf-8"))
 
         self.client.logger.log(f"Installed '{name}' to {script_path}", "info")
 
+    def install_many(self, names: typing.Iterable[str]) -> list[str]:
+        """
+        Install several cached scripts, writing them concurrently.
+
+        Parameters
+        ----------
+        names : Iterable[str]
+            Names of the files to install (without `.py`).
+
+        Returns
+        -------
+        list[str]
+            The names that were installed, in the order given. Names that
+            could not be installed are logged and left out.
+        """
+        names = list(dict.fromkeys(names))
+        if not names:
+            return []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(_MAX_INSTALL_WORKERS, len(names))
+        ) as executor:
+            futures = [executor.submit(self.install, name) for name in names]
+        installed: list[str] = []
+        for name, future in zip(names, futures, strict=True):
+            try:
+                future.result()
+            except (sierra_internal_errors.SierraCacheError, OSError) as e:
+                self.client.logger.log(
+                    f"Failed to install '{name}': {e}", "error"
+                )
+                continue
+            installed.append(name)
+        return installed
+
     def search(self, query: str) -> list[str]:
         """
         Searches for scripts in the cache by partial name match.
@@ -331,31 +1148,18 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
         List[str]
             Matching script names.
         """
-        results: list[str] = []
-
-        # Use the new CacheManager's keys() method
-        cache_keys = self.cache.keys(include_expired=False)
-
-        for key in cache_keys:
-            key_str = key
-            if query.lower() in key_str.lower():
-                # Verify it's a file entry by checking the cache
-                self.client.logger.log(
-                    f"Checking if {key_str} is a file entry", "debug"
-                )
-                entry_raw = self.cache.get(key_str)
-                if entry_raw:
-                    entry = typing.cast("dict[str, typing.Any]", entry_raw)
-                    if entry.get("type") == "file":
-                        self.client.logger.log(
-                            f"{key_str} is a file entry, adding to results",
-                            "debug",
-                        )
-                        results.append(key_str)
-
-        self.client.logger.log(
-            f"Search for '{query}' returned: {results}", "debug"
-        )
+        query_folded = query.casefold()
+        file_keys = self._file_key_index()
+        results = [
+            key
+            for key in self._live_file_keys()
+            if query_folded in file_keys[key]
+        ]
+
+        if self._debug_enabled:
+            self.client.logger.log(
+                f"Search for '{query}' returned: {results}", "debug"
+            )
         return results
 
     def list_available(self) -> list[str]:
@@ -367,28 +1171,68 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
         List[str]
             Cached script names.
         """
-        available: list[str] = []
+        available = self._live_file_keys()
 
-        # Use the new CacheManager's keys() method which handles both memory and disk
-        cache_keys = self.cache.keys(include_expired=False)
+        if self._debug_enabled:
+            self.client.logger.log(f"Cached .py scripts: {available}", "debug")
+        return available
 
-        for key in cache_keys:
-            key_str = key
-            self.client.logger.log(
-                f"Searching for '{key_str}' in cache.", "debug"
-            )
-            entry_raw = self.cache.get(key_str)
-            if entry_raw:
-                entry = typing.cast("dict[str, typing.Any]", entry_raw)
-                if entry.get("type") == "file":
-                    self.client.logger.log(
-                        f"Found '{key_str}' in cache, adding to results.",
-                        "debug",
-                    )
-                    available.append(key_str)
+    def _file_key_index(self) -> dict[str, str]:
+        """
+        Get the index of cached script names, building it on first use.
 
-        self.client.logger.log(f"Cached .py scripts: {available}", "debug")
-        return available
+        Returns
+        -------
+        dict[str, str]
+            Script names mapped to their case-folded form.
+        """
+        if self._file_keys is None:
+            entries = self._file_entries()
+            self._file_keys = {name: name.casefold() for name in entries}
+            self._other_keys = {
+                key for key in self.cache.keys() if key not in entries
+            }
+        return self._file_keys
+
+    def _live_file_keys(self) -> list[str]:
+        """
+        List the names of cached scripts that have not expired.
+
+        Entry values are read once per key: after the file-key index is
+        built, only keys it has not seen yet, such as scripts cached by
+        another process, are read and classified.
+
+        Returns
+        -------
+        list[str]
+            Cached script names, in cache key order.
+        """
+        file_keys = self._file_key_index()
+        live = self.cache.keys(include_expired=False)
+        for key in live:
+            if key in file_keys or key in self._other_keys:
+                continue
+            value = self.cache.get(key, peek=True)
+            if isinstance(value, dict) and value.get("type") == "file":
+                file_keys[key] = key.casefold()
+            elif value is not None:
+                self._other_keys.add(key)
+        return [key for key in live if key in file_keys]
+
+    def _file_entries(self) -> dict[str, dict[str, typing.Any]]:
+        """
+        Collect every cached script entry in a single pass over the cache.
+
+        Returns
+        -------
+        dict[str, dict[str, typing.Any]]
+            Cached file entries keyed by script name.
+        """
+        return {
+            key: value
+            for key, value in self.cache.items()
+            if isinstance(value, dict) and value.get("type") == "file"
+        }
 
     def info(self, name: str) -> dict[str, typing.Any]:
         """
@@ -409,15 +1253,21 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
         SierraCacheError
             If script not found in cache.
         """
-        self.client.logger.log(f"Retrieving info for '{name}'...", "debug")
-        entry_raw = self.cache.get(name)
+        if self._debug_enabled:
+            self.client.logger.log(f"Retrieving info for '{name}'...", "debug")
+        entry_raw = self.cache.get(name, peek=True)
         if not entry_raw:
             self.client.logger.log(f"No info found for '{name}'", "error")
             raise sierra_internal_errors.SierraCacheError(
                 f"Package '{name}' not found in cache."
             )
 
-        entry = typing.cast("dict[str, typing.Any]", entry_raw)
+        entry: dict[str, typing.Any] = entry_raw
+        # Byte length recorded at download; older entries fall back to the
+        # length of the stored text
+        content_length = entry.get("content_length")
+        if content_length is None:
+            content_length = len(entry.get("content", ""))
 
         # Get detailed cache information using the new CacheManager's get_entry_info method
         cache_info_raw = self.cache.get_entry_info(name)
@@ -429,7 +1279,7 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
                 "name": name,
                 "type": entry.get("type"),
                 "source": entry.get("source"),
-                "content_length": len(entry.get("content", "")),
+                "content_length": content_length,
                 "cache_info": {
                     "created_at": cache_info.get("created_at"),
                     "expires_at": cache_info.get("expires_at"),
@@ -446,10 +1296,11 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
                 "name": name,
                 "type": entry.get("type"),
                 "source": entry.get("source"),
-                "content_length": len(entry.get("content", "")),
+                "content_length": content_length,
             }
 
-        self.client.logger.log(f"Info for '{name}': {info_dict}", "debug")
+        if self._debug_enabled:
+            self.client.logger.log(f"Info for '{name}': {info_dict}", "debug")
         return info_dict
 
     def cleanup_expired(self) -> int:
@@ -477,39 +1328,26 @@ class SierraSideloader(sierra_core_base.SierraCoreObject):
             Cache statistics including file counts and sizes.
         """
         stats_raw = self.cache.stats()
-        self.client.logger.log(
-            f"Retrieved cache statistics: {stats_raw}", "debug"
-        )
+        if self._debug_enabled:
+            self.client.logger.log(
+                f"Retrieved cache statistics: {stats_raw}", "debug"
+            )
         stats = stats_raw
 
         # Add sideloader-specific stats
-        self.client.logger.log("Counting cached Python files", "debug")
-        file_count = 0
-        for key in self.cache.keys(include_expired=False):
+        file_count = len(self._live_file_keys())
+        if self._debug_enabled:
             self.client.logger.log(
-                f"Checking if '{key}' is a file entry", "debug"
-            )
-            entry_raw = self.cache.get(key)
-            if entry_raw:
-                self.client.logger.log(f"Checking type of '{key}'", "debug")
-                entry = typing.cast("dict[str, typing.Any]", entry_raw)
-                if entry.get("type") == "file":
-                    self.client.logger.log(
-                        f"Found '{key}' to be a file entry, incrementing count",
-                        "debug",
-                    )
-                    file_count += 1
-
-        self.client.logger.log(
-            f"Counted {file_count} cached Python files", "debug"
-        )
+                f"Counted {file_count} cached Python files", "debug"
+            )
         enhanced_stats: dict[str, typing.Any] = {
             **stats,
             "python_files_cached": file_count,
             "sources_configured": len(self.sources),
         }
 
-        self.client.logger.log(
-            f"Returning enhanced cache statistics: {enhanced_stats}", "debug"
-        )
+        if self._debug_enabled:
+            self.client.logger.log(
+                f"Returning enhanced cache statistics: {enhanced_stats}", "debug"
+            )
         return enhanced_stats
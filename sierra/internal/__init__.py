@@ -22,6 +22,7 @@ cache management, error handling, logging, and utility functions.
 - [SierraHTTPError](cci:2://file:///home/xsyncio/Downloads/sierra-dev/sierra/internal/errors.py:43:0-46:8): Error class for HTTP errors.
 - [SierraPathError](cci:2://file:///home/xsyncio/Downloads/sierra-dev/sierra/internal/errors.py:6:0-9:8): Error class for path-related errors.
 - [SierraPathNotFoundError](cci:2://file:///home/xsyncio/Downloads/sierra-dev/sierra/internal/errors.py:12:0-15:8): Error class for path not found errors.
+- `LazyMessage`: Log message rendered only when it is emitted.
 - `UniversalLogger`: Logger class for logging Sierra events.
 
 # Integration Notes
@@ -40,12 +41,14 @@ from sierra.internal.errors import SierraExecutionError
 from sierra.internal.errors import SierraHTTPError
 from sierra.internal.errors import SierraPathError
 from sierra.internal.errors import SierraPathNotFoundError
+from sierra.internal.logger import LazyMessage
 from sierra.internal.logger import UniversalLogger
 
 __all__ = [
     "BaseSierraError",
     "CacheManager",
     "CompressionType",
+    "LazyMessage",
     "SierraCacheError",
     "SierraClientLoadError",
     "SierraExecutionError",
@@ -1,4 +1,7 @@
+import collections
+import concurrent.futures
 import contextlib
+import functools
 import gzip
 import hashlib
 import json
@@ -8,16 +11,145 @@ import sqlite3
 import sys
 import threading
 import time
+import types
 import typing
 from dataclasses import dataclass
 from enum import Enum
 
+# orjson is an optional speedup, see the "speedups" extra
+_orjson: typing.Optional[types.ModuleType] = None
+try:
+    import orjson as _orjson_module  # type: ignore[import-not-found]
+
+    _orjson = _orjson_module
+except ImportError:
+    pass
+
+# zstd from the standard library (3.14+) or the "zstandard" package; either
+# is optional, and compressed entries fall back to gzip without them
+_zstd_compress: typing.Optional[typing.Callable[[bytes], bytes]] = None
+_zstd_decompress: typing.Optional[typing.Callable[[bytes], bytes]] = None
+try:
+    from compression import zstd as _zstd  # type: ignore[import-not-found]
+
+    _zstd_compress = functools.partial(_zstd.compress, level=3)
+    _zstd_decompress = _zstd.decompress
+except ImportError:
+    try:
+        import zstandard as _zstandard  # type: ignore[import-not-found]
+
+        # Module-level one-shot functions; compressor objects are not
+        # safe to share across threads
+        _zstd_compress = functools.partial(_zstandard.compress, level=3)
+        _zstd_decompress = _zstandard.decompress
+    except ImportError:
+        pass
+
+# DELETE ... RETURNING needs SQLite 3.35
+_HAS_RETURNING: bool = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Unlink workers for bulk deletes, and the batch size that warrants them
+_UNLINK_WORKERS: int = 8
+_PARALLEL_UNLINK_MIN: int = 32
+
+# Age after which a ``.tmp`` data file is taken to be left by a crash
+# rather than a write still in flight
+_STALE_TEMP_SECONDS: float = 3600.0
+
+# Deferred access-stat updates held before they are written in one batch
+_MAX_PENDING_STATS: int = 512
+
+# gzip level for compressed entries; level 3 keeps most of level 9's
+# ratio on JSON/source text at a fraction of the CPU cost
+_GZIP_LEVEL: int = 3
+
+# Statements run per operation. sqlite3 keeps prepared statements in a
+# per-connection cache keyed by the SQL text, so every call site must
+# pass the very same string for the cache to hit.
+_SQL_GET: str = (
+    "SELECT created_at, expires_at, compression, size_bytes, access_count, "
+    "last_accessed, data FROM cache_entries WHERE key = ?"
+)
+_SQL_GET_INFO: str = (
+    "SELECT created_at, expires_at, compression, size_bytes, access_count, "
+    "last_accessed FROM cache_entries WHERE key = ?"
+)
+_SQL_GET_CREATED: str = "SELECT created_at FROM cache_entries WHERE key = ?"
+_SQL_GET_EXPIRES: str = "SELECT expires_at FROM cache_entries WHERE key = ?"
+_SQL_HAS_FILE: str = "SELECT data IS NULL FROM cache_entries WHERE key = ?"
+_SQL_UPSERT: str = (
+    "INSERT OR REPLACE INTO cache_entries (key, created_at, expires_at, "
+    "compression, size_bytes, access_count, last_accessed, data) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_DEL: str = "DELETE FROM cache_entries WHERE key = ?"
+_SQL_DEL_ALL: str = "DELETE FROM cache_entries"
+_SQL_TOUCH: str = "UPDATE cache_entries SET expires_at = ? WHERE key = ?"
+_SQL_UPDATE_STATS: str = (
+    "UPDATE cache_entries SET access_count = ?, last_accessed = ? WHERE key = ?"
+)
+_SQL_ALL_KEYS: str = "SELECT key FROM cache_entries"
+_SQL_DATA_VERSION: str = "PRAGMA data_version"
+_SQL_LIVE_KEYS: str = (
+    "SELECT key, expires_at FROM cache_entries "
+    "WHERE expires_at IS NULL OR expires_at > ?"
+)
+_SQL_LIVE_ITEMS: str = (
+    "SELECT key, compression, data FROM cache_entries "
+    "WHERE expires_at IS NULL OR expires_at > ?"
+)
+_SQL_EXPIRED: str = (
+    "SELECT key, data IS NULL FROM cache_entries "
+    "WHERE expires_at IS NOT NULL AND expires_at <= ?"
+)
+_SQL_DEL_EXPIRED: str = (
+    "DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?"
+)
+_SQL_DEL_EXPIRED_RETURNING: str = _SQL_DEL_EXPIRED + " RETURNING key, data IS NULL"
+_SQL_COUNT: str = "SELECT COUNT(*) FROM cache_entries"
+_SQL_TOTAL_SIZE: str = "SELECT SUM(size_bytes) FROM cache_entries"
+_SQL_EVICT_CANDIDATES: str = (
+    "SELECT key FROM cache_entries "
+    "ORDER BY last_accessed ASC, access_count ASC LIMIT ?"
+)
+_SQL_STATS: str = (
+    "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0), "
+    "COALESCE(SUM(expires_at IS NOT NULL AND expires_at <= ?), 0) "
+    "FROM cache_entries"
+)
+
 
 class CompressionType(Enum):
     """Compression types for cache entries."""
 
     NONE = "none"
     GZIP = "gzip"
+    ZSTD = "zstd"
+
+
+# Codec for compress=True: zstd when available, gzip otherwise
+_DEFAULT_COMPRESSION: CompressionType = (
+    CompressionType.ZSTD if _zstd_compress is not None else CompressionType.GZIP
+)
+
+
+def _modified_before(path: pathlib.Path, timestamp: float) -> bool:
+    """Check whether a file was last modified before `timestamp`."""
+    try:
+        return path.stat().st_mtime < timestamp
+    except FileNotFoundError:
+        return False
+
+
+@functools.lru_cache(maxsize=4096)
+def _hash_key(key: str) -> str:
+    """
+    Hash a cache key into its data file's stem.
+
+    Memoized, since every read, write and delete of a key hashes it again.
+    SHA-256 is kept so files written by earlier versions are still found.
+    """
+    return hashlib.sha256(key.encode()).hexdigest()
 
 
 @dataclass
@@ -56,6 +188,9 @@ class CacheManager:
         max_memory_entries: int = 1000,
         cleanup_interval: float = 3600,  # 1 hour
         auto_cleanup: bool = True,
+        max_disk_bytes: typing.Optional[int] = None,
+        inline_threshold: int = 4096,
+        parallel_io: bool = True,
     ) -> None:
         """
         Initialize the CacheManager.
@@ -70,12 +205,40 @@ class CacheManager:
             Interval in seconds between automatic cleanup runs.
         auto_cleanup : bool
             Whether to automatically clean up expired entries.
+        max_disk_bytes : int, optional
+            Soft limit on the total size of persisted entries. Once a write
+            takes the cache past 90% of it, the least used tenth of the
+            entries is evicted. None (the default) means unbounded.
+        inline_threshold : int
+            Serialized values up to this many bytes are stored in the
+            SQLite row instead of a separate file, saving a file open per
+            read.
+        parallel_io : bool
+            Whether bulk deletes may unlink files on a small thread pool;
+            disable for strictly sequential I/O.
         """
-        self._memory_cache: typing.Dict[str, CacheEntry] = {}
+        # Kept in recency order, least recently used first
+        self._memory_cache: typing.OrderedDict[str, CacheEntry] = (
+            collections.OrderedDict()
+        )
         self._lock = threading.RLock()
         self._max_memory_entries = max_memory_entries
         self._cleanup_interval = cleanup_interval
         self._auto_cleanup = auto_cleanup
+        self._max_disk_bytes = max_disk_bytes
+        self._inline_threshold = inline_threshold
+        self._parallel_io = parallel_io
+        # key -> (access_count, last_accessed) not yet written to SQLite
+        self._pending_stats: typing.Dict[str, typing.Tuple[int, float]] = {}
+        # Live keys as (valid_until, data_version, keys); dropped by any
+        # persisted change here, stale once data_version moves
+        self._live_keys: typing.Optional[
+            typing.Tuple[float, int, typing.List[str]]
+        ] = None
+        # Keys with a row, loaded on first use and kept in step with this
+        # manager's writes; reloaded when another connection commits
+        self._disk_keys: typing.Optional[typing.Set[str]] = None
+        self._data_version: typing.Optional[int] = None
         self._last_cleanup = time.time()
 
         # Setup directories
@@ -86,6 +249,9 @@ class CacheManager:
 
         # Setup SQLite database
         self._db_path = self._base_dir / "cache.db"
+        # One connection for the manager's lifetime, shared across threads
+        # and serialized by self._lock
+        self._conn = self._connect()
         self._init_database()
 
     def _default_cache_dir(self) -> pathlib.Path:
@@ -101,9 +267,30 @@ class CacheManager:
         else:
             return pathlib.Path.home() / ".cache" / "sierra"
 
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the metadata database connection.
+
+        Applies the per-connection settings: ``synchronous=NORMAL`` (safe
+        under WAL, one fsync per checkpoint instead of per commit), a busy
+        timeout for concurrent writers, in-memory temp tables and a memory
+        mapped read path.
+        """
+        conn = sqlite3.connect(
+            self._db_path, timeout=5.0, check_same_thread=False
+        )
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+
     def _init_database(self) -> None:
         """Initialize the SQLite database."""
-        with sqlite3.connect(self._db_path) as conn:
+        with self._conn as conn:
+            # WAL lets readers run alongside a writer; it is a property of
+            # the database file, so setting it once here is enough
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS cache_entries (
                     key TEXT PRIMARY KEY,
@@ -112,21 +299,31 @@ class CacheManager:
                     compression TEXT NOT NULL,
                     size_bytes INTEGER NOT NULL,
                     access_count INTEGER NOT NULL DEFAULT 0,
-                    last_accessed REAL NOT NULL
+                    last_accessed REAL NOT NULL,
+                    data BLOB
                 )
             """)
+            # Databases created before small values were stored inline
+            columns = {
+                row[1] for row in conn.execute("PRAGMA table_info(cache_entries)")
+            }
+            if "data" not in columns:
+                conn.execute("ALTER TABLE cache_entries ADD COLUMN data BLOB")
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_expires_at ON cache_entries(expires_at)
             """)
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_last_accessed ON cache_entries(last_accessed)
             """)
+            # Covers stats(), so its scan never reads inline blobs
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_expires_size ON cache_entries(expires_at, size_bytes)
+            """)
             conn.commit()
 
     def _key_to_filename(self, key: str) -> pathlib.Path:
         """Convert a cache key to a filename."""
-        digest = hashlib.sha256(key.encode()).hexdigest()
-        return self._data_dir / f"{digest}.cache"
+        return self._data_dir / f"{_hash_key(key)}.cache"
 
     def _now(self) -> float:
         """Get current timestamp."""
@@ -141,16 +338,115 @@ class CacheManager:
     def _cleanup_if_needed(self) -> None:
         """Perform cleanup if needed."""
         if self._should_cleanup():
+            self._flush_stats()
             self._cleanup_expired()
 
+    def _record_access(self, entry: CacheEntry) -> None:
+        """Count an access in memory and queue it for the database."""
+        entry.access_count += 1
+        entry.last_accessed = self._now()
+        self._pending_stats[entry.key] = (entry.access_count, entry.last_accessed)
+        if len(self._pending_stats) > _MAX_PENDING_STATS:
+            self._flush_stats()
+
+    def _flush_stats(self) -> None:
+        """Write queued access statistics in a single transaction."""
+        if not self._pending_stats:
+            return
+        with self._conn as conn:
+            conn.executemany(
+                _SQL_UPDATE_STATS,
+                [
+                    (count, last, key)
+                    for key, (count, last) in self._pending_stats.items()
+                ],
+            )
+            conn.commit()
+        self._pending_stats.clear()
+
+    def _disk_key_set(self) -> typing.Set[str]:
+        """
+        Get the keys that have a row in the database.
+
+        Must be called with the lock held. ``PRAGMA data_version`` changes
+        only when another connection, e.g. another process sharing the
+        cache directory, commits; the set is then read again.
+        """
+        version = self._conn.execute(_SQL_DATA_VERSION).fetchone()[0]
+        if self._disk_keys is None or version != self._data_version:
+            self._disk_keys = {
+                row[0] for row in self._conn.execute(_SQL_ALL_KEYS)
+            }
+            self._data_version = version
+        return self._disk_keys
+
+    def _write_temp(self, filename: pathlib.Path, data: bytes) -> pathlib.Path:
+        """
+        Write the bytes for `filename` to a temporary file beside it.
+
+        The temporary name is unique to this process and thread; once
+        ``os.replace`` moves it over `filename`, readers see either the old
+        or the new bytes, and a crash mid-write leaves a stray ``.tmp``
+        file, never a truncated entry.
+        """
+        tmp = filename.with_name(
+            f"{filename.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            with open(tmp, "wb") as f:
+                f.write(data)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                tmp.unlink()
+            raise
+        return tmp
+
+    def _discard_temps(
+        self, temps: typing.Iterable[typing.Optional[pathlib.Path]]
+    ) -> None:
+        """Remove temporary files that were written but not published."""
+        for tmp in temps:
+            if tmp is not None:
+                with contextlib.suppress(FileNotFoundError):
+                    tmp.unlink()
+
+    def _unlink_files(self, paths: typing.List[pathlib.Path]) -> None:
+        """
+        Remove data files, ignoring ones that are gone or cannot be removed.
+
+        Large batches are spread over a thread pool so the syscalls'
+        latency overlaps, which matters on network or spinning storage.
+        """
+
+        def unlink(path: pathlib.Path) -> None:
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+        if self._parallel_io and len(paths) >= _PARALLEL_UNLINK_MIN:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=_UNLINK_WORKERS
+            ) as executor:
+                list(executor.map(unlink, paths))
+        else:
+            for path in paths:
+                unlink(path)
+
     def _serialize_value(
         self, value: typing.Any, compression: CompressionType
     ) -> bytes:
         """Serialize and optionally compress a value."""
-        json_data = json.dumps(value, default=str).encode("utf-8")
+        if _orjson is not None:
+            # Same JSON on disk, so entries stay readable either way
+            json_data: bytes = _orjson.dumps(
+                value, default=str, option=_orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            json_data = json.dumps(value, default=str).encode("utf-8")
 
-        if compression == CompressionType.GZIP:
-            return gzip.compress(json_data)
+        if compression == CompressionType.ZSTD and _zstd_compress is not None:
+            return _zstd_compress(json_data)
+        elif compression == CompressionType.GZIP:
+            return gzip.compress(json_data, compresslevel=_GZIP_LEVEL)
         else:
             return json_data
 
@@ -158,83 +454,93 @@ class CacheManager:
         self, data: bytes, compression: CompressionType
     ) -> typing.Any:
         """Deserialize and decompress a value."""
-        if compression == CompressionType.GZIP:
+        if compression == CompressionType.ZSTD:
+            if _zstd_decompress is None:
+                raise ValueError("zstd entry but no zstd module available")
+            json_data = _zstd_decompress(data)
+        elif compression == CompressionType.GZIP:
             json_data = gzip.decompress(data)
         else:
             json_data = data
 
-        return json.loads(json_data.decode("utf-8"))
+        if _orjson is not None:
+            return _orjson.loads(json_data)
+        return json.loads(json_data)
 
     def _evict_lru_memory(self) -> None:
         """Evict least recently used items from memory cache."""
-        if len(self._memory_cache) <= self._max_memory_entries:
-            return
-
-        # Sort by last_accessed and remove oldest entries
-        sorted_entries = sorted(
-            self._memory_cache.items(), key=lambda x: x[1].last_accessed
-        )
+        while len(self._memory_cache) > self._max_memory_entries:
+            self._memory_cache.popitem(last=False)
 
-        # Remove oldest entries to get back to max size
-        excess_count = len(self._memory_cache) - self._max_memory_entries
-        for i in range(excess_count):
-            key = sorted_entries[i][0]
-            del self._memory_cache[key]
-
-    def _load_from_disk(self, key: str) -> typing.Optional[CacheEntry]:
-        """Load a cache entry from disk."""
-        with sqlite3.connect(self._db_path) as conn:
-            cursor = conn.execute(
-                "SELECT created_at, expires_at, compression, size_bytes, access_count, last_accessed "
-                "FROM cache_entries WHERE key = ?",
-                (key,),
-            )
-            row = cursor.fetchone()
-            if not row:
-                return None
-
-            (
-                created_at,
-                expires_at,
-                compression_str,
-                size_bytes,
-                access_count,
-                last_accessed,
-            ) = row
-            compression = CompressionType(compression_str)
-
-            # Check if expired
-            if expires_at and self._now() > expires_at:
-                self.delete(key)
-                return None
+    def _fetch_row(self, key: str) -> typing.Optional[typing.Tuple[typing.Any, ...]]:
+        """
+        Read the metadata row of a live persistent entry.
 
-            # Load the actual value
-            filename = self._key_to_filename(key)
-            if not filename.exists():
-                # Inconsistent state - remove from database
-                conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
-                conn.commit()
-                return None
+        Must be called with the lock held. Expired rows are deleted.
+        """
+        with self._conn as conn:
+            row: typing.Optional[typing.Tuple[typing.Any, ...]] = conn.execute(
+                _SQL_GET, (key,)
+            ).fetchone()
+        if not row:
+            return None
+
+        # Check if expired
+        expires_at = row[1]
+        if expires_at and self._now() > expires_at:
+            self.delete(key)
+            return None
+        return row
+
+    def _load_from_disk(
+        self, key: str, row: typing.Tuple[typing.Any, ...]
+    ) -> typing.Optional[CacheEntry]:
+        """
+        Load a cache entry from its row and, for large values, its file.
 
-            try:
-                with open(filename, "rb") as f:
+        Called without the lock, so file reads and deserialization do not
+        block other threads. A missing or corrupted file removes the entry,
+        unless it was replaced in the meantime.
+        """
+        (
+            created_at,
+            expires_at,
+            compression_str,
+            size_bytes,
+            access_count,
+            last_accessed,
+            data,
+        ) = row
+        compression = CompressionType(compression_str)
+
+        try:
+            # Load the actual value; small values are stored in the row
+            if data is None:
+                with open(self._key_to_filename(key), "rb") as f:
                     data = f.read()
-                value = self._deserialize_value(data, compression)
-
-                return CacheEntry(
-                    key=key,
-                    value=value,
-                    created_at=created_at,
-                    expires_at=expires_at,
-                    compression=compression,
-                    size_bytes=size_bytes,
-                    access_count=access_count,
-                    last_accessed=last_accessed,
-                )
-            except Exception:
-                # Corrupted file - remove both file and database entry
-                self.delete(key)
-                return None
+            value = self._deserialize_value(data, compression)
+        except Exception:
+            # Missing or corrupted file - remove both file and database
+            # entry, unless a concurrent set has already replaced them
+            with self._lock:
+                if key not in self._memory_cache:
+                    current = self._conn.execute(
+                        _SQL_GET_CREATED, (key,)
+                    ).fetchone()
+                    if current is not None and current[0] == created_at:
+                        self.delete(key)
+            return None
+
+        return CacheEntry(
+            key=key,
+            value=value,
+            created_at=created_at,
+            expires_at=expires_at,
+            compression=compression,
+            size_bytes=size_bytes,
+            access_count=access_count,
+            last_accessed=last_accessed,
+        )
 
     def set(
         self,
@@ -260,48 +566,116 @@ class CacheManager:
         compress : bool
             Whether to compress the value.
         """
+        self.set_many([(key, value)], ttl=ttl, persist=persist, compress=compress)
+
+    def set_many(
+        self,
+        items: typing.Iterable[typing.Tuple[str, typing.Any]],
+        ttl: typing.Optional[float] = None,
+        persist: bool = True,
+        compress: bool = False,
+    ) -> None:
+        """
+        Store several values in the cache in one database transaction.
+
+        Parameters
+        ----------
+        items : Iterable[Tuple[str, Any]]
+            ``(key, value)`` pairs to cache.
+        ttl : float, optional
+            Time to live in seconds, shared by all items.
+        persist : bool
+            Whether to persist to disk (default: True).
+        compress : bool
+            Whether to compress the values.
+        """
+        # Later duplicates win, as they would with one set() per item
+        pending = dict(items)
+        compression = _DEFAULT_COMPRESSION if compress else CompressionType.NONE
+
+        prepared: typing.List[
+            typing.Tuple[
+                str,
+                typing.Any,
+                typing.Optional[bytes],
+                typing.Optional[pathlib.Path],
+            ]
+        ] = []
+        if persist:
+            # Serialize and write large values outside the lock; only the
+            # publishing rename and the row update below need to hold it
+            try:
+                for key, value in pending.items():
+                    data = self._serialize_value(value, compression)
+                    tmp = None
+                    if len(data) > self._inline_threshold:
+                        tmp = self._write_temp(self._key_to_filename(key), data)
+                    prepared.append((key, value, data, tmp))
+            except BaseException:
+                self._discard_temps(tmp for _, _, _, tmp in prepared)
+                raise
+        else:
+            # Memory hits return the live object, so values that never
+            # reach disk need no serialized form at all
+            compression = CompressionType.NONE
+            prepared = [(key, value, None, None) for key, value in pending.items()]
+
         with self._lock:
             self._cleanup_if_needed()
 
+            if persist:
+                try:
+                    for key, _, serialized_data, tmp in prepared:
+                        filename = self._key_to_filename(key)
+                        if tmp is None:
+                            # Small values live in the row; drop any file
+                            # left by an earlier, larger value under this key
+                            with contextlib.suppress(FileNotFoundError):
+                                filename.unlink()
+                        elif serialized_data is not None:
+                            # Publish the file written above
+                            try:
+                                os.replace(tmp, filename)
+                            except FileNotFoundError:
+                                # Removed meanwhile, e.g. by a clear()
+                                # that took it for stale; write it again
+                                os.replace(
+                                    self._write_temp(filename, serialized_data),
+                                    filename,
+                                )
+                except BaseException:
+                    self._discard_temps(tmp for _, _, _, tmp in prepared)
+                    raise
+
             now = self._now()
             expires_at = now + ttl if ttl else None
-            compression = (
-                CompressionType.GZIP if compress else CompressionType.NONE
-            )
 
-            # Serialize the value
-            serialized_data = self._serialize_value(value, compression)
-            size_bytes = len(serialized_data)
-
-            entry = CacheEntry(
-                key=key,
-                value=value,
-                created_at=now,
-                expires_at=expires_at,
-                compression=compression,
-                size_bytes=size_bytes,
-                access_count=0,
-                last_accessed=now,
-            )
+            rows: typing.List[typing.Tuple[typing.Any, ...]] = []
+            for key, value, serialized_data, tmp in prepared:
+                # Memory-only values are never serialized, so they are
+                # left out of the byte accounting
+                size_bytes = (
+                    0 if serialized_data is None else len(serialized_data)
+                )
 
-            # Store in memory cache
-            self._memory_cache[key] = entry
-            self._evict_lru_memory()
+                # Accesses queued for the old value must not carry over
+                self._pending_stats.pop(key, None)
 
-            if persist:
-                # Save to disk
-                filename = self._key_to_filename(key)
-                with open(filename, "wb") as f:
-                    f.write(serialized_data)
-
-                # Update database
-                with sqlite3.connect(self._db_path) as conn:
-                    conn.execute(
-                        """
-                        INSERT OR REPLACE INTO cache_entries 
-                        (key, created_at, expires_at, compression, size_bytes, access_count, last_accessed)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
+                # Store in memory cache, as the most recently used entry
+                self._memory_cache.pop(key, None)
+                self._memory_cache[key] = CacheEntry(
+                    key=key,
+                    value=value,
+                    created_at=now,
+                    expires_at=expires_at,
+                    compression=compression,
+                    size_bytes=size_bytes,
+                    access_count=0,
+                    last_accessed=now,
+                )
+
+                if persist:
+                    rows.append(
                         (
                             key,
                             now,
@@ -310,11 +684,84 @@ class CacheManager:
                             size_bytes,
                             0,
                             now,
-                        ),
+                            serialized_data if tmp is None else None,
+                        )
                     )
+            self._evict_lru_memory()
+
+            if rows:
+                self._live_keys = None
+                # Update database, all rows in one commit
+                with self._conn as conn:
+                    conn.executemany(_SQL_UPSERT, rows)
                     conn.commit()
+                if self._disk_keys is not None:
+                    self._disk_keys.update(row[0] for row in rows)
+
+                if self._max_disk_bytes is not None:
+                    self._evict_if_over_capacity(
+                        self._max_disk_bytes, keep=pending.keys()
+                    )
+
+    def _evict_if_over_capacity(
+        self, max_disk_bytes: int, keep: typing.Collection[str] = ()
+    ) -> None:
+        """
+        Evict the least recently used entries once disk usage nears the limit.
+
+        Keys in `keep`, the ones just written, are never chosen; they have
+        no accesses yet and would otherwise rank first.
+        """
+        with self._conn as conn:
+            total = conn.execute(_SQL_TOTAL_SIZE).fetchone()[0]
+        if total and total > 0.9 * max_disk_bytes:
+            self._evict(0.1, keep)
+
+    def evict(self, fraction: float = 0.1) -> int:
+        """
+        Evict the least valuable share of the persisted entries.
+
+        Entries are ranked by last access, then by access count, so the
+        least recently used go first and use count breaks ties. Expired
+        entries are not treated specially; ``cleanup`` handles those.
+
+        Parameters
+        ----------
+        fraction : float
+            Share of the persisted entries to remove, between 0 and 1. At
+            least one entry is removed if any exist.
+
+        Returns
+        -------
+        int
+            Number of entries removed.
+        """
+        return self._evict(fraction, ())
+
+    def _evict(self, fraction: float, keep: typing.Collection[str]) -> int:
+        """Evict like ``evict``, never choosing a key in `keep`."""
+        with self._lock:
+            with self._conn as conn:
+                total = conn.execute(_SQL_COUNT).fetchone()[0]
+                if not total:
+                    return 0
+                # The ranking must see queued access stats
+                self._flush_stats()
+                limit = max(1, int(total * fraction))
+                # Over-fetch by len(keep) so the statement stays constant
+                victims = [
+                    row[0]
+                    for row in conn.execute(
+                        _SQL_EVICT_CANDIDATES, (limit + len(keep),)
+                    )
+                    if row[0] not in keep
+                ][:limit]
+                conn.commit()
+
+            self.delete_many(victims)
+            return len(victims)
 
-    def get(self, key: str) -> typing.Optional[typing.Any]:
+    def get(self, key: str, peek: bool = False) -> typing.Optional[typing.Any]:
         """
         Retrieve a value from the cache.
 
@@ -322,6 +769,10 @@ class CacheManager:
         ----------
         key : str
             Cache key.
+        peek : bool
+            Read without counting an access: access statistics and LRU
+            order are left alone and disk entries are not promoted to
+            memory. For introspection and maintenance paths.
 
         Returns
         -------
@@ -338,33 +789,50 @@ class CacheManager:
                     self.delete(key)
                     return None
 
-                # Update access statistics
-                entry.access_count += 1
-                entry.last_accessed = self._now()
+                if peek:
+                    return entry.value
 
+                self._record_access(entry)
+                self._memory_cache.move_to_end(key)
                 return entry.value
 
-            # Load from disk
-            entry = self._load_from_disk(key)
-            if entry is None:
+            row = self._fetch_row(key)
+            if row is None:
+                return None
+
+        # Load from disk without holding the lock
+        entry = self._load_from_disk(key, row)
+        if entry is None:
+            return None
+        if peek:
+            return entry.value
+
+        with self._lock:
+            current = self._memory_cache.get(key)
+            if current is not None:
+                # Set or loaded by another thread meanwhile; theirs is
+                # at least as new as what was read here
+                self._record_access(current)
+                self._memory_cache.move_to_end(key)
+                return current.value
+
+            # Do not resurrect an entry deleted or replaced meanwhile
+            still = self._conn.execute(_SQL_GET_CREATED, (key,)).fetchone()
+            if still is None or still[0] != entry.created_at:
                 return None
 
-            # Update access statistics
-            entry.access_count += 1
-            entry.last_accessed = self._now()
+            # Queued accesses are newer than the stored counters
+            entry.access_count, entry.last_accessed = self._pending_stats.get(
+                key, (entry.access_count, entry.last_accessed)
+            )
+
+            # Statistics are queued, not written, so a read stays a read
+            self._record_access(entry)
 
             # Store in memory cache
             self._memory_cache[key] = entry
             self._evict_lru_memory()
 
-            # Update database statistics
-            with sqlite3.connect(self._db_path) as conn:
-                conn.execute(
-                    "UPDATE cache_entries SET access_count = ?, last_accessed = ? WHERE key = ?",
-                    (entry.access_count, entry.last_accessed, key),
-                )
-                conn.commit()
-
             return entry.value
 
     def exists(self, key: str) -> bool:
@@ -380,6 +848,11 @@ class CacheManager:
         -------
         bool
             True if the key exists and is valid.
+
+        Notes
+        -----
+        Keys without a stored row are answered from an in-memory set of
+        stored keys, so a miss costs no row lookup.
         """
         with self._lock:
             # Check memory first
@@ -390,12 +863,13 @@ class CacheManager:
                     return False
                 return True
 
+            # Absent keys are answered from the key set, without a lookup
+            if key not in self._disk_key_set():
+                return False
+
             # Check database
-            with sqlite3.connect(self._db_path) as conn:
-                cursor = conn.execute(
-                    "SELECT expires_at FROM cache_entries WHERE key = ?",
-                    (key,),
-                )
+            with self._conn as conn:
+                cursor = conn.execute(_SQL_GET_EXPIRES, (key,))
                 row = cursor.fetchone()
                 if not row:
                     return False
@@ -407,6 +881,36 @@ class CacheManager:
 
                 return True
 
+    def touch(self, key: str, ttl: typing.Optional[float] = None) -> bool:
+        """
+        Renew the expiry of an existing entry without rewriting its value.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+        ttl : float, optional
+            New time to live in seconds, counted from now. None means the
+            entry never expires.
+
+        Returns
+        -------
+        bool
+            True if the entry exists and was renewed.
+        """
+        with self._lock:
+            expires_at = self._now() + ttl if ttl else None
+
+            entry = self._memory_cache.get(key)
+            if entry is not None:
+                entry.expires_at = expires_at
+
+            with self._conn as conn:
+                cursor = conn.execute(_SQL_TOUCH, (expires_at, key))
+                conn.commit()
+                self._live_keys = None
+                return entry is not None or cursor.rowcount > 0
+
     def delete(self, key: str) -> None:
         """
         Delete a cache entry.
@@ -416,35 +920,69 @@ class CacheManager:
         key : str
             Cache key.
         """
-        with self._lock:
-            # Remove from memory
-            self._memory_cache.pop(key, None)
+        self.delete_many([key])
 
-            # Remove from disk
-            filename = self._key_to_filename(key)
-            with contextlib.suppress(FileNotFoundError):
-                filename.unlink()
+    def delete_many(self, keys: typing.Iterable[str]) -> None:
+        """
+        Delete several cache entries in one database transaction.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            Cache keys.
+        """
+        with self._lock:
+            keys = list(keys)
+            files: typing.List[pathlib.Path] = []
+            for key in keys:
+                # Remove from memory
+                self._memory_cache.pop(key, None)
+                self._pending_stats.pop(key, None)
+
+                # Remove from disk, unless the value is stored inline
+                row = self._conn.execute(_SQL_HAS_FILE, (key,)).fetchone()
+                if row is not None and not row[0]:
+                    continue
+                files.append(self._key_to_filename(key))
+            self._unlink_files(files)
 
             # Remove from database
-            with sqlite3.connect(self._db_path) as conn:
-                conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            with self._conn as conn:
+                conn.executemany(_SQL_DEL, [(key,) for key in keys])
                 conn.commit()
+            self._live_keys = None
+            if self._disk_keys is not None:
+                self._disk_keys.difference_update(keys)
 
     def clear(self) -> None:
         """Clear all cache entries."""
         with self._lock:
             # Clear memory
             self._memory_cache.clear()
-
-            # Clear disk files
-            for file in self._data_dir.glob("*.cache"):
-                with contextlib.suppress(Exception):
-                    file.unlink()
+            self._pending_stats.clear()
+
+            # Clear disk files, and temp files left by a crash; recent ones
+            # may belong to a set() still writing outside the lock
+            stale_before = time.time() - _STALE_TEMP_SECONDS
+            self._unlink_files(
+                [
+                    file
+                    for file in self._data_dir.iterdir()
+                    if file.suffix == ".cache"
+                    or (
+                        file.suffix == ".tmp"
+                        and _modified_before(file, stale_before)
+                    )
+                ]
+            )
 
             # Clear database
-            with sqlite3.connect(self._db_path) as conn:
-                conn.execute("DELETE FROM cache_entries")
+            with self._conn as conn:
+                conn.execute(_SQL_DEL_ALL)
                 conn.commit()
+            self._live_keys = None
+            if self._disk_keys is not None:
+                self._disk_keys.clear()
 
     def keys(self, include_expired: bool = False) -> typing.List[str]:
         """
@@ -459,20 +997,73 @@ class CacheManager:
         -------
         List[str]
             List of cache keys.
+
+        Notes
+        -----
+        The live-key list is memoized until a persisted entry changes, here
+        or through another connection, or the earliest live entry expires,
+        so repeated calls between writes cost no key query.
         """
         with self._lock:
             if include_expired:
-                with sqlite3.connect(self._db_path) as conn:
-                    cursor = conn.execute("SELECT key FROM cache_entries")
+                with self._conn as conn:
+                    cursor = conn.execute(_SQL_ALL_KEYS)
                     return [row[0] for row in cursor.fetchall()]
             else:
                 now = self._now()
-                with sqlite3.connect(self._db_path) as conn:
-                    cursor = conn.execute(
-                        "SELECT key FROM cache_entries WHERE expires_at IS NULL OR expires_at > ?",
-                        (now,),
+                # Changes only when another connection commits
+                version = self._conn.execute(_SQL_DATA_VERSION).fetchone()[0]
+                if (
+                    self._live_keys is not None
+                    and now < self._live_keys[0]
+                    and version == self._live_keys[1]
+                ):
+                    return list(self._live_keys[2])
+                with self._conn as conn:
+                    rows = conn.execute(_SQL_LIVE_KEYS, (now,)).fetchall()
+                keys = [row[0] for row in rows]
+                valid_until = min(
+                    (row[1] for row in rows if row[1] is not None),
+                    default=float("inf"),
+                )
+                self._live_keys = (valid_until, version, keys)
+                return list(keys)
+
+    def items(self) -> typing.List[typing.Tuple[str, typing.Any]]:
+        """
+        Get all live persistent entries as ``(key, value)`` pairs.
+
+        Unlike calling ``get`` per key, this reads the metadata in one query
+        and does not record an access for every entry it returns.
+
+        Returns
+        -------
+        List[Tuple[str, Any]]
+            Key/value pairs of all non-expired entries.
+        """
+        with self._lock:
+            now = self._now()
+            with self._conn as conn:
+                rows = conn.execute(_SQL_LIVE_ITEMS, (now,)).fetchall()
+
+            result: typing.List[typing.Tuple[str, typing.Any]] = []
+            for key, compression_str, data in rows:
+                entry = self._memory_cache.get(key)
+                if entry is not None:
+                    result.append((key, entry.value))
+                    continue
+                try:
+                    if data is None:
+                        with open(self._key_to_filename(key), "rb") as f:
+                            data = f.read()
+                    value = self._deserialize_value(
+                        data, CompressionType(compression_str)
                     )
-                    return [row[0] for row in cursor.fetchall()]
+                except Exception:
+                    # Missing or corrupted file; get() will clean it up
+                    continue
+                result.append((key, value))
+            return result
 
     def _cleanup_expired(self) -> int:
         """Clean up expired entries and return count of removed entries."""
@@ -491,28 +1082,32 @@ class CacheManager:
                 removed_count += 1
 
             # Clean up persistent storage
-            with sqlite3.connect(self._db_path) as conn:
-                # Get expired entries
-                cursor = conn.execute(
-                    "SELECT key FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
-                    (now,),
-                )
-                expired_persistent = [row[0] for row in cursor.fetchall()]
-
-                # Remove files
-                for key in expired_persistent:
-                    filename = self._key_to_filename(key)
-                    with contextlib.suppress(FileNotFoundError):
-                        filename.unlink()
-
-                # Remove from database
-                conn.execute(
-                    "DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
-                    (now,),
-                )
+            with self._conn as conn:
+                if _HAS_RETURNING:
+                    # Delete and collect the expired rows in one pass
+                    expired_persistent = conn.execute(
+                        _SQL_DEL_EXPIRED_RETURNING, (now,)
+                    ).fetchall()
+                else:
+                    expired_persistent = conn.execute(
+                        _SQL_EXPIRED, (now,)
+                    ).fetchall()
+                    conn.execute(_SQL_DEL_EXPIRED, (now,))
                 conn.commit()
 
-                removed_count += len(expired_persistent)
+            # Remove files; inline entries have none
+            self._unlink_files(
+                [
+                    self._key_to_filename(key)
+                    for key, has_file in expired_persistent
+                    if has_file
+                ]
+            )
+            removed_count += len(expired_persistent)
+            if self._disk_keys is not None:
+                self._disk_keys.difference_update(
+                    key for key, _ in expired_persistent
+                )
 
             self._last_cleanup = now
             return removed_count
@@ -537,22 +1132,13 @@ class CacheManager:
         Dict[str, Any]
             Statistics dictionary.
         """
-        with self._lock and sqlite3.connect(self._db_path) as conn:
-            # Total entries
-            cursor = conn.execute("SELECT COUNT(*) FROM cache_entries")
-            total_entries = cursor.fetchone()[0]
-
-            # Total size
-            cursor = conn.execute("SELECT SUM(size_bytes) FROM cache_entries")
-            total_size = cursor.fetchone()[0] or 0
-
-            # Expired entries
+        with self._lock, self._conn as conn:
+            # Entry count, total size and expired count in one pass over
+            # idx_expires_size, without touching the (blob-carrying) rows
             now = self._now()
-            cursor = conn.execute(
-                "SELECT COUNT(*) FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
-                (now,),
-            )
-            expired_entries = cursor.fetchone()[0]
+            total_entries, total_size, expired_entries = conn.execute(
+                _SQL_STATS, (now,)
+            ).fetchone()
 
             return {
                 "total_entries": total_entries,
@@ -595,13 +1181,12 @@ class CacheManager:
                     "in_memory": True,
                 }
 
+            if key in self._pending_stats:
+                self._flush_stats()
+
             # Check database
-            with sqlite3.connect(self._db_path) as conn:
-                cursor = conn.execute(
-                    "SELECT created_at, expires_at, compression, size_bytes, access_count, last_accessed "
-                    "FROM cache_entries WHERE key = ?",
-                    (key,),
-                )
+            with self._conn as conn:
+                cursor = conn.execute(_SQL_GET_INFO, (key,))
                 row = cursor.fetchone()
                 if not row:
                     return None
@@ -628,5 +1213,7 @@ class CacheManager:
     def close(self) -> None:
         """Close the cache manager and perform final cleanup."""
         with self._lock:
+            self._flush_stats()
             self._cleanup_expired()
             self._memory_cache.clear()
+            self._conn.close()
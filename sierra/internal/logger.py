@@ -110,6 +110,29 @@ class LogColor:
     ICON_ERROR: str = "❌"
 
 
+class LazyMessage:
+    """
+    Log message whose text is built only if the entry is emitted.
+
+    Wraps a zero-argument callable; ``str()`` calls it. Use it for messages
+    that interpolate paths or container reprs on hot paths so nothing is
+    formatted when the level is filtered out.
+
+    Parameters
+    ----------
+    func : Callable[[], str]
+        Builds the message text.
+    """
+
+    __slots__ = ("func",)
+
+    def __init__(self, func: typing.Callable[[], str]) -> None:
+        self.func: typing.Callable[[], str] = func
+
+    def __str__(self) -> str:
+        return self.func()
+
+
 class LogBuffer:
     """
     In-memory FIFO buffer for log entries.
@@ -288,6 +311,24 @@ class UniversalLogger:
         allowed: set[LogTypeLiteral] = UniversalLogger._LEVEL_MAP[self.level]
         return typ in allowed
 
+    def is_enabled_for(self, log_type: LogTypeLiteral) -> bool:
+        """
+        Check whether messages of ``log_type`` would be emitted.
+
+        Lets callers skip building expensive messages that would be dropped.
+
+        Parameters
+        ----------
+        log_type : Literal["info","warning","debug","error"]
+            Message type.
+
+        Returns
+        -------
+        bool
+            True if the current level emits this type.
+        """
+        return self._should_log(log_type)
+
     def _write_file(self, line: str) -> None:
         """
         Append a line to the log file, if configured.
@@ -305,21 +346,34 @@ class UniversalLogger:
         except Exception as err:
             sys.stderr.write(f"File log error: {err}\n")
 
-    def log(self, message: str, log_type: LogTypeLiteral) -> None:
+    def log(
+        self,
+        message: typing.Union[str, LazyMessage],
+        log_type: LogTypeLiteral,
+        *args: typing.Any,
+    ) -> None:
         """
         Emit a log entry.
 
         Parameters
         ----------
-        message : str
-            Content of the log.
+        message : str or LazyMessage
+            Content of the log. A LazyMessage is rendered only if the entry
+            passes the level filter.
         log_type : Literal["info","warning","debug","error"]
             Severity level.
+        *args : Any
+            Optional ``%``-style arguments for `message`, as with
+            :mod:`logging`; they are interpolated only if the entry passes
+            the level filter.
         """
         if not self._should_log(log_type):
             return
 
-        line: str = self._format(message, log_type)
+        text = str(message)
+        if args:
+            text = text % args
+        line: str = self._format(text, log_type)
         self.buffer.add(line)
 
         if self.clean_logs:
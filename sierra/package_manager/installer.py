@@ -12,7 +12,7 @@ from pathlib import Path
 
 import httpx
 
-from sierra.internal.logger import UniversalLogger
+from sierra.internal.logger import LazyMessage, UniversalLogger
 
 
 class PackageInstaller:
@@ -43,8 +43,8 @@ class PackageInstaller:
         self.env_path = Path(environment_path)
         self.scripts_path = self.env_path / "scripts"
         self.scripts_path.mkdir(parents=True, exist_ok=True)
-        self.logger.log(f"Environment path: {self.env_path}", "debug")
-        self.logger.log(f"Scripts path: {self.scripts_path}", "debug")
+        self.logger.log(LazyMessage(lambda: f"Environment path: {self.env_path}"), "debug")
+        self.logger.log(LazyMessage(lambda: f"Scripts path: {self.scripts_path}"), "debug")
         
         self.installed_file = self.repo_manager.config_dir / "installed.json"
         self.installed: dict[str, dict] = {}
@@ -12,7 +12,7 @@ from pathlib import Path
 
 import httpx
 
-from sierra.internal.logger import UniversalLogger
+from sierra.internal.logger import LazyMessage, UniversalLogger
 
 
 @dataclass
@@ -62,12 +62,12 @@ class RepositoryManager:
         
         self.config_dir = Path(config_dir)
         self.config_dir.mkdir(parents=True, exist_ok=True)
-        self.logger.log(f"Config directory: {self.config_dir}", "debug")
+        self.logger.log(LazyMessage(lambda: f"Config directory: {self.config_dir}"), "debug")
         
         self.sources_file = self.config_dir / "sources.json"
         self.cache_dir = self.config_dir / "cache" / "registry"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.logger.log(f"Cache directory: {self.cache_dir}", "debug")
+        self.logger.log(LazyMessage(lambda: f"Cache directory: {self.cache_dir}"), "debug")
         
         self.sources: list[RepositorySource] = []
         self.load_sources()
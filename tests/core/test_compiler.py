@@ -0,0 +1,158 @@
+"""
+Tests for SierraCompiler.
+"""
+import pathlib
+from types import SimpleNamespace
+
+import pytest
+
+from sierra.core.compiler import SierraCompiler
+
+
+@pytest.fixture
+def compiler(mock_logger, temp_dir):
+    """Create a compiler bound to a lightweight fake client."""
+    client = SimpleNamespace(
+        logger=mock_logger,
+        invokers=[],
+        environment=SimpleNamespace(
+            config_path=temp_dir,
+            invokers_path=temp_dir / "invokers",
+        ),
+    )
+    return SierraCompiler(client=client)
+
+
+class TestToDoubleQuotedString:
+    """Test SierraCompiler.to_double_quoted_string."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("hello", "hello"),
+            ('"world"', "world"),
+            ("hello world", '"hello world"'),
+            ('"hello world"', '"hello world"'),
+            ("", ""),
+        ],
+    )
+    def test_quoting(self, text, expected):
+        """Only strings containing spaces are quoted."""
+        assert SierraCompiler.to_double_quoted_string(text) == expected
+
+
+class TestMergeDeduplicateSortedLatest:
+    """Test requirement merging."""
+
+    def test_keeps_highest_version(self, compiler):
+        """The highest pinned version of a package wins."""
+        result = compiler.merge_deduplicate_sorted_latest(
+            ["requests==2.9.0", "requests==2.10.1", "requests==2.10.0"]
+        )
+        assert result == ["requests==2.10.1"]
+
+    def test_deduplicates_and_sorts(self, compiler):
+        """Plain requirements are deduplicated and the result is sorted."""
+        result = compiler.merge_deduplicate_sorted_latest(
+            iter(["httpx", "colorama==0.4.6", "httpx"])
+        )
+        assert result == ["colorama==0.4.6", "httpx"]
+
+    def test_malformed_version_is_plain(self, compiler):
+        """Malformed pins are kept verbatim instead of raising."""
+        result = compiler.merge_deduplicate_sorted_latest(["pkg==1..2"])
+        assert result == ["pkg==1..2"]
+
+
+class TestMakeInvokerYaml:
+    """Test YAML generation."""
+
+    def test_param_types_and_options(self, compiler):
+        """Path parameters map to FILE and mandatory ones list the option."""
+        compiler.client.invokers.append(
+            SimpleNamespace(
+                name="lookup",
+                description="Lookup tool",
+                command="python lookup.py",
+                params=[
+                    {
+                        "Name": "target",
+                        "Description": "Target",
+                        "Type": pathlib.Path,
+                        "Options": "MANDATORY",
+                    },
+                    {
+                        "Name": "mode",
+                        "Description": None,
+                        "Type": str,
+                        "Options": None,
+                    },
+                ],
+            )
+        )
+
+        yaml_str = compiler.make_invoker_yaml()
+
+        assert yaml_str.startswith("PATHS:\n")
+        assert (
+            "      - Name: target\n"
+            "        Description: Target\n"
+            "        Type: FILE\n"
+            "        Options:\n"
+            "          - MANDATORY\n"
+        ) in yaml_str
+        assert (
+            "      - Name: mode\n"
+            "        Description: \n"
+            "        Type: STRING\n"
+        ) in yaml_str
+        assert yaml_str.endswith("    Command: >python lookup.py")
+
+    def test_optional_path_is_file(self, compiler):
+        """Union annotations containing a path type map to FILE."""
+        compiler.client.invokers.append(
+            SimpleNamespace(
+                name="scan",
+                description="Scan tool",
+                command="python scan.py",
+                params=[
+                    {
+                        "Name": "target",
+                        "Description": "Target",
+                        "Type": pathlib.Path | None,
+                        "Options": None,
+                    },
+                    {
+                        "Name": "count",
+                        "Description": "Count",
+                        "Type": int | None,
+                        "Options": None,
+                    },
+                ],
+            )
+        )
+
+        yaml_str = compiler.make_invoker_yaml()
+
+        assert (
+            "      - Name: target\n"
+            "        Description: Target\n"
+            "        Type: FILE"
+        ) in yaml_str
+        assert (
+            "      - Name: count\n"
+            "        Description: Count\n"
+            "        Type: STRING"
+        ) in yaml_str
+
+
+class TestCompile:
+    """Test the full compile step."""
+
+    def test_no_invokers_writes_skeleton_only(self, compiler, temp_dir):
+        """Without invokers only an empty config.yaml is produced."""
+        compiler.compile()
+
+        config = (temp_dir / "config.yaml").read_text(encoding="utf-8")
+        assert config.endswith("SCRIPTS:")
+        assert not (temp_dir / "invokers").exists()
@@ -0,0 +1,74 @@
+"""
+Tests for environment helpers.
+"""
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from sierra.core.environment import SierraDevelopmentEnvironment, _fast_rmtree
+from sierra.internal.errors import SierraPathError
+
+
+@pytest.mark.skipif(os.name == "nt", reason="removed with rmdir on Windows")
+class TestFastRmtree:
+    """Test the recursive environment delete."""
+
+    def test_removes_nested_tree(self, temp_dir):
+        """Files, subdirectories and directory symlinks are all removed."""
+        root = temp_dir / "venv"
+        (root / "lib" / "site-packages").mkdir(parents=True)
+        (root / "lib" / "site-packages" / "mod.py").write_text("x = 1\n")
+        (root / "pyvenv.cfg").write_text("home = /usr\n")
+        (root / "lib64").symlink_to("lib")
+
+        _fast_rmtree(root)
+
+        assert not os.path.lexists(root)
+
+    def test_missing_path_raises(self, temp_dir):
+        """A missing directory raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            _fast_rmtree(temp_dir / "missing")
+
+
+class TestInit:
+    """Test SierraDevelopmentEnvironment.init."""
+
+    def test_rejects_file_at_environment_path(self, mock_logger, temp_dir):
+        """A file where the environment should be fails before any setup."""
+        (temp_dir / "env").write_text("not a directory")
+        environment = SierraDevelopmentEnvironment(
+            SimpleNamespace(logger=mock_logger), name="env", path=temp_dir
+        )
+
+        with pytest.raises(SierraPathError):
+            environment.init()
+
+    def test_creates_layout_without_virtualenv(self, mock_logger, temp_dir):
+        """init() lays out directories and files but defers the venv."""
+        environment = SierraDevelopmentEnvironment(
+            SimpleNamespace(logger=mock_logger), name="env", path=temp_dir
+        )
+
+        environment.init()
+
+        assert environment.scripts_path.is_dir()
+        assert environment.invokers_path.is_dir()
+        assert (environment.config_path / "config.yaml").is_file()
+        assert not environment.venv_path.exists()
+
+    def test_incomplete_venv_is_not_ready(self, mock_logger, temp_dir):
+        """A venv directory without its interpreter is rebuilt on first use."""
+        client = SimpleNamespace(logger=mock_logger)
+        venv_path = SierraDevelopmentEnvironment(
+            client, name="env", path=temp_dir
+        ).venv_path
+        venv_path.mkdir(parents=True)
+        (venv_path / "pyvenv.cfg").write_text("home = /usr\n")
+
+        environment = SierraDevelopmentEnvironment(
+            client, name="env", path=temp_dir
+        )
+
+        assert not environment._venv_ready
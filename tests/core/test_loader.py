@@ -0,0 +1,660 @@
+"""
+Tests for SierraSideloader.
+"""
+import contextlib
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from sierra.core.loader import SierraSideloader
+from sierra.internal.cache import CacheManager
+from sierra.internal.errors import SierraHTTPError
+
+LISTING_URL = "https://api.github.com/repos/example/scripts/contents"
+
+
+class FakeResponse:
+    """Minimal stand-in for an httpx response."""
+
+    def __init__(self, status_code=200, json_data=None, text="", headers=None):
+        self.status_code = status_code
+        self._json_data = json_data
+        self.text = text
+        self.content = (
+            json.dumps(json_data).encode("utf-8")
+            if json_data is not None
+            else text.encode("utf-8")
+        )
+        self.headers = headers or {}
+
+    def json(self):
+        return self._json_data
+
+    def iter_bytes(self, chunk_size=None):
+        self.chunks_read = 0
+        step = chunk_size or len(self.content) or 1
+        for start in range(0, len(self.content), step):
+            self.chunks_read += 1
+            yield self.content[start:start + step]
+
+
+class FakeHTTPClient:
+    """Serve canned responses by URL and record every request."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requested = []
+        self.request_headers = {}
+        self._lock = threading.Lock()
+
+    def head(self, url, **kwargs):
+        with self._lock:
+            self.requested.append(("HEAD", url))
+        response = self.responses.get(url, FakeResponse(status_code=404))
+        return response({}) if callable(response) else response
+
+    def get(self, url, headers=None, **kwargs):
+        with self._lock:
+            self.requested.append(url)
+            self.request_headers[url] = headers or {}
+        response = self.responses.get(url, FakeResponse(status_code=404))
+        return response(headers or {}) if callable(response) else response
+
+    def stream(self, method, url, headers=None, **kwargs):
+        return contextlib.nullcontext(self.get(url, headers=headers))
+
+
+def _listing(*paths):
+    return [
+        {
+            "type": "file",
+            "path": path,
+            "download_url": f"https://raw.example.com/{path}",
+        }
+        for path in paths
+    ]
+
+
+@pytest.fixture
+def make_loader(mock_logger, temp_dir):
+    """Build a sideloader over a fake HTTP client and a real cache."""
+    caches = []
+
+    def _make(responses, sources=(LISTING_URL,), **kwargs):
+        config_path = temp_dir / "env"
+        config_path.mkdir(exist_ok=True)
+        (config_path / "source").write_text("\n".join(sources) + "\n")
+        caches.append(CacheManager(cache_dir=temp_dir / "cache"))
+        client = SimpleNamespace(
+            logger=mock_logger,
+            cache=caches[-1],
+            http_client=FakeHTTPClient(responses),
+            environment=SimpleNamespace(
+                config_path=config_path,
+                scripts_path=config_path / "scripts",
+            ),
+        )
+        return SierraSideloader(client=client, **kwargs)
+
+    yield _make
+    for cache in caches:
+        cache.close()
+
+
+class TestPopulate:
+    """Test SierraSideloader.populate."""
+
+    def test_downloads_python_files_only(self, make_loader):
+        """Every .py file in a listing is cached; other files are ignored."""
+        responses = {
+            LISTING_URL: FakeResponse(
+                json_data=_listing("alpha.py", "beta.py", "README.md")
+            ),
+            "https://raw.example.com/alpha.py": FakeResponse(text="a = 1\n"),
+            "https://raw.example.com/beta.py": FakeResponse(text="b = 2\n"),
+        }
+        loader = make_loader(responses)
+
+        loader.populate()
+
+        assert sorted(loader.list_available()) == ["alpha", "beta"]
+        assert loader.cache.get("alpha")["content"] == "a = 1\n"
+
+    def test_skips_cached_and_failed_downloads(self, make_loader):
+        """Cached names are not refetched and HTTP failures are not fatal."""
+        responses = {
+            LISTING_URL: FakeResponse(
+                json_data=_listing("alpha.py", "broken.py")
+            ),
+            "https://raw.example.com/alpha.py": FakeResponse(text="a = 1\n"),
+        }
+        loader = make_loader(responses)
+        loader.populate()
+        loader.client.http_client.requested.clear()
+
+        loader.populate()
+
+        assert "https://raw.example.com/alpha.py" not in (
+            loader.client.http_client.requested
+        )
+        assert loader.list_available() == ["alpha"]
+
+    def test_timeout_skips_only_its_own_script(self, make_loader):
+        """A transport error fails one download, not the whole batch."""
+
+        def stalled(headers):
+            raise httpx.ReadTimeout("timed out")
+
+        responses = {
+            LISTING_URL: FakeResponse(
+                json_data=_listing("alpha.py", "slow.py")
+            ),
+            "https://raw.example.com/alpha.py": FakeResponse(text="a = 1\n"),
+            "https://raw.example.com/slow.py": stalled,
+        }
+        loader = make_loader(responses)
+        loader.populate()
+
+        assert loader.list_available() == ["alpha"]
+
+    def test_non_utf8_body_is_rejected(self, make_loader):
+        """Bodies that are not UTF-8 are skipped, not cached with U+FFFD."""
+        latin1 = FakeResponse()
+        latin1.content = "name = 'caf\xe9'\n".encode("latin-1")
+        raw = "# caf\u00e9\r\nx = 1\r\n".encode("utf-8")
+        utf8 = FakeResponse()
+        utf8.content = raw
+        responses = {
+            LISTING_URL: FakeResponse(json_data=_listing("bad.py", "good.py")),
+            "https://raw.example.com/bad.py": latin1,
+            "https://raw.example.com/good.py": utf8,
+        }
+        loader = make_loader(responses)
+        loader.populate()
+        assert loader.list_available() == ["good"]
+
+        loader.install("good")
+        script = loader.client.environment.scripts_path / "good.py"
+        assert script.read_bytes() == raw
+
+    def test_rejects_non_script_responses(self, make_loader):
+        """HTML pages and JSON API errors served with 200 are not cached."""
+        responses = {
+            LISTING_URL: FakeResponse(
+                json_data=_listing("html.py", "limited.py", "good.py")
+            ),
+            "https://raw.example.com/html.py": FakeResponse(
+                text="<html></html>",
+                headers={"Content-Type": "text/html; charset=utf-8"},
+            ),
+            "https://raw.example.com/limited.py": FakeResponse(
+                text='{"message": "API rate limit exceeded"}',
+                headers={"Content-Type": "text/plain"},
+            ),
+            "https://raw.example.com/good.py": FakeResponse(
+                text="g = 1\n",
+                headers={"Content-Type": "text/plain; charset=utf-8"},
+            ),
+        }
+        loader = make_loader(responses)
+
+        loader.populate()
+
+        assert loader.list_available() == ["good"]
+
+    def test_oversized_body_is_not_read_in_full(self, make_loader, monkeypatch):
+        """Streaming stops once a body passes the script size cap."""
+        monkeypatch.setattr("sierra.core.loader._MAX_SCRIPT_BYTES", 10)
+        monkeypatch.setattr("sierra.core.loader._DOWNLOAD_CHUNK_BYTES", 4)
+        big = FakeResponse(text="x" * 100)
+        responses = {
+            LISTING_URL: FakeResponse(json_data=_listing("big.py")),
+            "https://raw.example.com/big.py": big,
+        }
+        loader = make_loader(responses)
+
+        loader.populate()
+
+        assert loader.list_available() == []
+        assert big.chunks_read == 3
+
+    def test_compressed_body_over_cap_is_rejected(self, make_loader, monkeypatch):
+        """A gzip body whose declared size is under the cap is still rejected."""
+        monkeypatch.setattr("sierra.core.loader._MAX_SCRIPT_BYTES", 1000)
+        monkeypatch.setattr("sierra.core.loader._DOWNLOAD_CHUNK_BYTES", 100)
+        responses = {
+            LISTING_URL: FakeResponse(json_data=_listing("big.py")),
+            # Content-Length counts the compressed bytes, the body is decoded
+            "https://raw.example.com/big.py": FakeResponse(
+                text="x" * 6000,
+                headers={"Content-Encoding": "gzip", "Content-Length": "200"},
+            ),
+        }
+        loader = make_loader(responses)
+
+        loader.populate()
+
+        assert loader.list_available() == []
+
+    def test_size_check_uses_decoded_body(self, make_loader, monkeypatch):
+        """The decoded length decides; a compressed Content-Length does not."""
+        monkeypatch.setattr("sierra.core.loader._MAX_SCRIPT_BYTES", 1000)
+        loader = make_loader({})
+        encoded = {"Content-Encoding": "gzip", "Content-Length": "2000"}
+
+        loader._validate_script_response(
+            "https://raw.example.com/small.py",
+            FakeResponse(text="x" * 900, headers=encoded),
+        )
+        with pytest.raises(SierraHTTPError):
+            loader._validate_script_response(
+                "https://raw.example.com/big.py",
+                FakeResponse(text="x" * 6000, headers={"Content-Length": "200"}),
+            )
+
+    def test_shared_url_is_downloaded_once(self, make_loader):
+        """Two listed names pointing at one URL cost a single download."""
+        shared_url = "https://raw.example.com/shared.py"
+        responses = {
+            LISTING_URL: FakeResponse(
+                json_data=[
+                    {"type": "file", "path": "one.py",
+                     "download_url": shared_url},
+                    {"type": "file", "path": "two.py",
+                     "download_url": shared_url},
+                ]
+            ),
+            shared_url: FakeResponse(text="s\n"),
+        }
+        loader = make_loader(responses)
+
+        loader.populate()
+
+        assert loader.client.http_client.requested.count(shared_url) == 1
+        assert loader.cache.get("one")["content"] == "s\n"
+        assert loader.cache.get("two")["content"] == "s\n"
+
+    def test_downloads_respect_max_concurrency(self, make_loader):
+        """No more than ``max_concurrency`` downloads run at once."""
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+
+        def slow_script(headers):
+            with lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.pop()
+            return FakeResponse(text="x = 1\n")
+
+        names = [f"s{i}.py" for i in range(6)]
+        responses = {LISTING_URL: FakeResponse(json_data=_listing(*names))}
+        for name in names:
+            responses[f"https://raw.example.com/{name}"] = slow_script
+        loader = make_loader(responses, max_concurrency=2)
+
+        loader.populate()
+
+        assert len(loader.list_available()) == 6
+        assert max(peak) <= 2
+
+    def test_retries_server_errors(self, make_loader, monkeypatch):
+        """A 503 followed by a 200 still caches the script."""
+        sleeps = []
+        monkeypatch.setattr("sierra.core.loader.time.sleep", sleeps.append)
+        replies = iter(
+            [FakeResponse(status_code=503), FakeResponse(text="a = 1\n")]
+        )
+        responses = {
+            LISTING_URL: FakeResponse(json_data=_listing("alpha.py")),
+            "https://raw.example.com/alpha.py": lambda headers: next(replies),
+        }
+        loader = make_loader(responses)
+
+        loader.populate()
+
+        assert loader.list_available() == ["alpha"]
+        assert len(sleeps) == 1 and 1 <= sleeps[0] <= 2
+
+    def test_stops_calling_api_once_quota_is_spent(self, make_loader):
+        """Sources after an exhausted rate limit are skipped locally."""
+        other_listing = "https://api.github.com/repos/example/other/contents"
+        responses = {
+            LISTING_URL: FakeResponse(
+                json_data=[],
+                headers={
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": str(time.time() + 3600),
+                },
+            ),
+            other_listing: FakeResponse(json_data=[]),
+        }
+        # One worker, so the second listing starts after the first returns
+        loader = make_loader(
+            responses, sources=(LISTING_URL, other_listing), max_concurrency=1
+        )
+
+        loader.populate()
+
+        assert loader.client.http_client.requested == [LISTING_URL]
+
+    def test_same_host_listings_are_fetched_concurrently(self, make_loader):
+        """Listings on one host do not wait for each other."""
+        other_listing = "https://api.github.com/repos/example/other/contents"
+        both_started = threading.Barrier(2, timeout=5)
+
+        def listing(headers):
+            both_started.wait()
+            return FakeResponse(json_data=[])
+
+        loader = make_loader(
+            {LISTING_URL: listing, other_listing: listing},
+            sources=(LISTING_URL, other_listing),
+        )
+
+        loader.populate()
+
+        assert not both_started.broken
+
+    def test_first_source_wins_across_hosts(self, make_loader):
+        """Listings fetched concurrently still resolve names in source order."""
+        mirror = "https://mirror.example.org/scripts.json"
+        responses = {
+            LISTING_URL: FakeResponse(json_data=_listing("alpha.py")),
+            mirror: FakeResponse(
+                json_data=[
+                    {"type": "file", "path": "alpha.py",
+                     "download_url": "https://mirror.example.org/alpha.py"},
+                ]
+            ),
+            "https://raw.example.com/alpha.py": FakeResponse(text="a = 1\n"),
+            "https://mirror.example.org/alpha.py": FakeResponse(text="m\n"),
+        }
+        loader = make_loader(responses, sources=(mirror, LISTING_URL))
+
+        loader.populate()
+
+        requested = loader.client.http_client.requested
+        assert {mirror, LISTING_URL} <= set(requested)
+        assert loader.cache.get("alpha")["content"] == "m\n"
+
+    def test_duplicate_sources_are_fetched_once(self, make_loader):
+        """Repeated source lines, with or without a scheme, cost one request."""
+        responses = {LISTING_URL: FakeResponse(json_data=[])}
+        bare = LISTING_URL.removeprefix("https://")
+        loader = make_loader(
+            responses, sources=(LISTING_URL, bare, LISTING_URL)
+        )
+
+        loader.populate()
+
+        assert loader.sources == [LISTING_URL, bare]
+        assert loader.client.http_client.requested == [LISTING_URL]
+
+    def test_unchanged_listing_is_served_from_cache(self, make_loader):
+        """A 304 on the listing reuses the cached copy of its entries."""
+
+        def serve_listing(headers):
+            if headers.get("If-None-Match") == '"l1"':
+                return FakeResponse(status_code=304)
+            listing = _listing("alpha.py")
+            listing[0]["sha"] = "0" * 40
+            return FakeResponse(json_data=listing, headers={"ETag": '"l1"'})
+
+        responses = {
+            LISTING_URL: serve_listing,
+            "https://raw.example.com/alpha.py": FakeResponse(text="a = 1\n"),
+        }
+        loader = make_loader(responses)
+        loader.populate()
+        loader.cache.delete("alpha")
+
+        loader.populate()
+
+        http = loader.client.http_client
+        assert http.request_headers[LISTING_URL] == {"If-None-Match": '"l1"'}
+        assert loader.list_available() == ["alpha"]
+        stored = loader.cache.get(f"listing::{LISTING_URL}")["data"]
+        assert "sha" not in stored[0]
+
+    def test_commit_pinned_scripts_get_longer_lease(self, make_loader):
+        """Scripts addressed by commit SHA are cached longer than branches."""
+        pinned_url = f"https://raw.example.com/org/repo/{'a' * 40}/pinned.py"
+        responses = {
+            LISTING_URL: FakeResponse(
+                json_data=[
+                    {"type": "file", "path": "pinned.py",
+                     "download_url": pinned_url},
+                    *_listing("branch.py"),
+                ]
+            ),
+            pinned_url: FakeResponse(text="p\n"),
+            "https://raw.example.com/branch.py": FakeResponse(text="b\n"),
+        }
+        loader = make_loader(responses)
+
+        loader.populate()
+
+        pinned = loader.cache.get_entry_info("pinned")
+        branch = loader.cache.get_entry_info("branch")
+        assert (pinned["expires_at"] - pinned["created_at"]) > (
+            branch["expires_at"] - branch["created_at"]
+        )
+
+
+class TestUpdate:
+    """Test SierraSideloader.update."""
+
+    def test_unchanged_script_is_revalidated_not_refetched(self, make_loader):
+        """A 304 keeps the cached content and renews the entry."""
+        script_url = "https://raw.example.com/alpha.py"
+
+        def serve_script(headers):
+            if headers.get("If-None-Match") == '"v1"':
+                return FakeResponse(status_code=304)
+            return FakeResponse(text="a = 1\n", headers={"ETag": '"v1"'})
+
+        responses = {
+            LISTING_URL: FakeResponse(json_data=_listing("alpha.py")),
+            script_url: serve_script,
+        }
+        loader = make_loader(responses)
+        loader.populate()
+        expires_before = loader.cache.get_entry_info("alpha")["expires_at"]
+
+        loader.update()
+
+        http = loader.client.http_client
+        assert http.request_headers[script_url] == {"If-None-Match": '"v1"'}
+        assert loader.cache.get("alpha")["content"] == "a = 1\n"
+        assert loader.cache.get_entry_info("alpha")["expires_at"] >= (
+            expires_before
+        )
+
+    def test_changed_script_is_replaced(self, make_loader):
+        """A 200 on revalidation stores the new content and ETag."""
+        script_url = "https://raw.example.com/alpha.py"
+        responses = {
+            LISTING_URL: FakeResponse(json_data=_listing("alpha.py")),
+            script_url: FakeResponse(text="a = 1\n", headers={"ETag": '"v1"'}),
+        }
+        loader = make_loader(responses)
+        loader.populate()
+        responses[script_url] = FakeResponse(
+            text="a = 2\n", headers={"ETag": '"v2"'}
+        )
+
+        loader.update()
+
+        entry = loader.cache.get("alpha")
+        assert entry["content"] == "a = 2\n"
+        assert entry["etag"] == '"v2"'
+
+    def test_unlisted_scripts_are_removed(self, make_loader, mock_logger):
+        """Scripts dropped from every listing are purged, not revalidated."""
+        responses = {
+            LISTING_URL: FakeResponse(
+                json_data=_listing("alpha.py", "beta.py"),
+                headers={"ETag": '"l1"'},
+            ),
+            "https://raw.example.com/alpha.py": FakeResponse(
+                text="a = 1\n", headers={"ETag": '"v1"'}
+            ),
+            "https://raw.example.com/beta.py": FakeResponse(text="b = 2\n"),
+        }
+        loader = make_loader(responses)
+        loader.populate()
+        responses["https://raw.example.com/alpha.py"] = FakeResponse(
+            status_code=304
+        )
+        responses[LISTING_URL] = FakeResponse(
+            json_data=_listing("alpha.py"), headers={"ETag": '"l2"'}
+        )
+        http = loader.client.http_client
+        http.requested.clear()
+
+        loader.update()
+
+        assert loader.list_available() == ["alpha"]
+        assert "https://raw.example.com/beta.py" not in http.requested
+        mock_logger.log.assert_any_call(
+            "Revalidated 1 cached scripts, 0 changed", "info"
+        )
+
+    def test_scripts_are_kept_when_a_listing_fails(self, make_loader):
+        """A failed listing does not count as its scripts being removed."""
+        responses = {
+            LISTING_URL: FakeResponse(json_data=_listing("alpha.py")),
+            "https://raw.example.com/alpha.py": FakeResponse(text="a = 1\n"),
+        }
+        loader = make_loader(responses)
+        loader.populate()
+        responses[LISTING_URL] = FakeResponse(status_code=404)
+
+        loader.update()
+
+        assert loader.list_available() == ["alpha"]
+
+    def test_script_without_validators_is_checked_by_size(self, make_loader):
+        """Without ETag/Last-Modified a HEAD with equal size skips the GET."""
+        script_url = "https://raw.example.com/alpha.py"
+        responses = {
+            LISTING_URL: FakeResponse(json_data=_listing("alpha.py")),
+            script_url: FakeResponse(
+                text="a = 1\n", headers={"Content-Length": "6"}
+            ),
+        }
+        loader = make_loader(responses)
+        loader.populate()
+        http = loader.client.http_client
+        http.requested.clear()
+
+        loader.update()
+
+        assert ("HEAD", script_url) in http.requested
+        assert script_url not in http.requested
+
+    def test_encoded_size_is_not_compared(self, make_loader):
+        """An encoded Content-Length never matches the decoded cached size."""
+        script_url = "https://raw.example.com/alpha.py"
+        responses = {
+            LISTING_URL: FakeResponse(json_data=_listing("alpha.py")),
+            script_url: FakeResponse(
+                text="a = 1\n", headers={"Content-Length": "6"}
+            ),
+        }
+        loader = make_loader(responses)
+        loader.populate()
+        responses[script_url] = FakeResponse(
+            text="a = 1\n",
+            headers={"Content-Encoding": "gzip", "Content-Length": "6"},
+        )
+        http = loader.client.http_client
+        http.requested.clear()
+
+        loader.update()
+
+        assert ("HEAD", script_url) in http.requested
+        assert script_url in http.requested
+
+
+class TestSearch:
+    """Test SierraSideloader.search."""
+
+    def test_matches_script_names_only(self, make_loader):
+        """Search is case-insensitive and never returns listing entries."""
+        responses = {
+            LISTING_URL: FakeResponse(
+                json_data=_listing("DNS_lookup.py", "whois.py"),
+                headers={"ETag": '"l1"'},
+            ),
+            "https://raw.example.com/DNS_lookup.py": FakeResponse(text="x\n"),
+            "https://raw.example.com/whois.py": FakeResponse(text="y\n"),
+        }
+        loader = make_loader(responses)
+        assert loader.search("lookup") == []
+
+        loader.populate()
+
+        assert loader.search("dns") == ["DNS_lookup"]
+        assert loader.search("listing") == []
+
+    def test_query_is_case_folded(self, make_loader):
+        """Case-insensitive matching uses full Unicode case folding."""
+        loader = make_loader({})
+        loader.cache.set(
+            "Straße_scan", {"content": "x\n", "type": "file", "source": "x"}
+        )
+
+        assert loader.search("STRASSE") == ["Straße_scan"]
+
+    def test_scripts_cached_elsewhere_are_found(self, make_loader):
+        """Scripts cached by another loader show up after the index is built."""
+        loader = make_loader({})
+        other = make_loader({})
+        assert loader.search("scan") == []
+
+        other.cache.set(
+            "port_scan", {"content": "x\n", "type": "file", "source": "x"}
+        )
+
+        assert loader.search("scan") == ["port_scan"]
+        assert loader.list_available() == ["port_scan"]
+
+
+class TestInstall:
+    """Test SierraSideloader.install."""
+
+    def test_writes_cached_script(self, make_loader):
+        """An installed script lands in the scripts directory verbatim."""
+        loader = make_loader({})
+        loader.cache.set(
+            "alpha", {"content": "a = 1\n", "type": "file", "source": "x"}
+        )
+
+        loader.install("alpha")
+
+        script = loader.client.environment.scripts_path / "alpha.py"
+        assert script.read_text(encoding="utf-8") == "a = 1\n"
+
+    def test_install_many_skips_missing(self, make_loader):
+        """Several scripts install in one call; unknown names are skipped."""
+        loader = make_loader({})
+        for name in ("alpha", "beta"):
+            loader.cache.set(
+                name, {"content": f"{name}\n", "type": "file", "source": "x"}
+            )
+
+        assert loader.install_many(["alpha", "missing", "beta"]) == [
+            "alpha",
+            "beta",
+        ]
+        scripts = loader.client.environment.scripts_path
+        assert (scripts / "beta.py").read_text(encoding="utf-8") == "beta\n"
+        assert not (scripts / "missing.py").exists()
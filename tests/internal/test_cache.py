@@ -0,0 +1,396 @@
+"""
+Tests for the CacheManager.
+"""
+import contextlib
+import os
+import sqlite3
+import threading
+import time
+
+import pytest
+
+import sierra.internal.cache as sierra_internal_cache
+from sierra.internal.cache import CacheManager, CompressionType
+
+
+@pytest.fixture
+def open_cache(temp_dir):
+    """Open cache managers under temp_dir, closing them all at teardown."""
+    managers = []
+
+    def _open(name, **kwargs):
+        kwargs.setdefault("auto_cleanup", False)
+        manager = CacheManager(cache_dir=temp_dir / name, **kwargs)
+        managers.append(manager)
+        return manager
+
+    yield _open
+    for manager in managers:
+        # Tests may close a manager themselves
+        with contextlib.suppress(sqlite3.ProgrammingError):
+            manager.close()
+
+
+@pytest.fixture
+def cache(open_cache):
+    """Create a cache manager rooted in a temporary directory."""
+    return open_cache("cache")
+
+
+class TestCacheManager:
+    """Test basic CacheManager behaviour."""
+
+    def test_set_and_get_round_trip(self, cache):
+        """Test values survive a set/get round trip, compressed or not."""
+        cache.set("plain", {"a": 1})
+        cache.set("packed", {"b": [1, 2]}, compress=True)
+
+        assert cache.get("plain") == {"a": 1}
+        assert cache.get("packed") == {"b": [1, 2]}
+
+    def test_gzip_entries_stay_readable(self, cache, open_cache, monkeypatch):
+        """Test entries written with gzip load whatever the default codec."""
+        monkeypatch.setattr(
+            sierra_internal_cache, "_DEFAULT_COMPRESSION", CompressionType.GZIP
+        )
+        cache.set("old", {"a": 1}, compress=True)
+        monkeypatch.undo()
+        cache.set("new", {"b": 2}, compress=True)
+
+        reopened = open_cache("cache")
+        assert reopened.get_entry_info("old")["compression"] == "gzip"
+        assert reopened.get_entry_info("new")["compression"] == (
+            sierra_internal_cache._DEFAULT_COMPRESSION.value
+        )
+        assert reopened.get("old") == {"a": 1}
+        assert reopened.get("new") == {"b": 2}
+
+    def test_get_from_disk_after_restart(self, cache, open_cache):
+        """Test persisted entries are readable by a new manager."""
+        cache.set("key", "value", compress=True)
+
+        reopened = open_cache("cache")
+        assert reopened.get("key") == "value"
+        assert reopened.keys() == ["key"]
+
+    def test_disk_read_does_not_hold_the_lock(self, open_cache, monkeypatch):
+        """Test other threads can write while a value is deserialized."""
+        cache = open_cache("cache")
+        cache.set("key", "value")
+        reopened = open_cache("cache")
+        deserialize = reopened._deserialize_value
+
+        def delete_meanwhile(data, compression):
+            worker = threading.Thread(target=reopened.delete, args=("key",))
+            worker.start()
+            worker.join(timeout=5)
+            assert not worker.is_alive()
+            return deserialize(data, compression)
+
+        monkeypatch.setattr(reopened, "_deserialize_value", delete_meanwhile)
+        # The entry deleted during the read is not put back in memory
+        assert reopened.get("key") is None
+        assert not reopened.exists("key")
+
+    def test_memory_only_values_are_not_serialized(self, cache, monkeypatch):
+        """Test set(persist=False) keeps the live object without encoding it."""
+
+        def fail(value, compression):
+            raise AssertionError("serialized a memory-only value")
+
+        monkeypatch.setattr(cache, "_serialize_value", fail)
+        value = object()
+        cache.set("key", value, persist=False, compress=True)
+
+        assert cache.get("key") is value
+        assert cache.get_entry_info("key")["compression"] == "none"
+        assert cache.keys() == []
+
+    def test_exists_sees_writes_from_other_managers(self, cache, open_cache):
+        """Test the stored-key set follows local and foreign writes."""
+        cache.set("local", 1)
+        assert cache.exists("local")
+        assert not cache.exists("foreign")
+
+        other = open_cache("cache")
+        other.set("foreign", 2)
+        assert cache.exists("foreign")
+
+        cache.delete("local")
+        assert not cache.exists("local")
+
+    def test_database_uses_wal(self, cache, temp_dir):
+        """Test the metadata database is switched to WAL journaling."""
+        conn = sqlite3.connect(temp_dir / "cache" / "cache.db")
+        try:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        finally:
+            conn.close()
+        assert mode == "wal"
+
+    def test_small_values_are_stored_inline(self, open_cache, temp_dir):
+        """Test values under the threshold get no file of their own."""
+        cache = open_cache("inline", inline_threshold=64)
+        cache.set("small", "x")
+        cache.set("large", "x" * 100)
+        data_dir = temp_dir / "inline" / "data"
+        assert len(list(data_dir.glob("*.cache"))) == 1
+
+        cache.set("large", "y")
+        assert list(data_dir.glob("*.cache")) == []
+
+        reopened = open_cache("inline")
+        assert reopened.get("small") == "x"
+        assert reopened.get("large") == "y"
+
+    def test_failed_write_keeps_previous_file(self, open_cache, temp_dir, monkeypatch):
+        """Test an interrupted file write leaves the old value readable."""
+        cache = open_cache("atomic", inline_threshold=0)
+        cache.set("key", "old")
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("sierra.internal.cache.os.replace", fail)
+        with pytest.raises(OSError):
+            cache.set("key", "new")
+        monkeypatch.undo()
+
+        data_dir = temp_dir / "atomic" / "data"
+        assert [p.suffix for p in data_dir.iterdir()] == [".cache"]
+        reopened = open_cache("atomic")
+        assert reopened.get("key") == "old"
+
+    def test_clear_spares_temp_files_in_flight(self, cache, temp_dir):
+        """Test clear() only sweeps temp files old enough to be orphans."""
+        data_dir = temp_dir / "cache" / "data"
+        fresh = data_dir / "fresh.cache.1.2.tmp"
+        orphan = data_dir / "orphan.cache.1.2.tmp"
+        fresh.write_bytes(b"x")
+        orphan.write_bytes(b"x")
+        old = time.time() - 2 * sierra_internal_cache._STALE_TEMP_SECONDS
+        os.utime(orphan, (old, old))
+
+        cache.clear()
+
+        assert fresh.exists()
+        assert not orphan.exists()
+
+    def test_vanished_temp_file_is_rewritten(self, open_cache, monkeypatch):
+        """Test set() still publishes if its temp file disappears first."""
+        cache = open_cache("cache", inline_threshold=0)
+        write_temp = cache._write_temp
+        calls = []
+
+        def write_then_lose(filename, data):
+            tmp = write_temp(filename, data)
+            calls.append(tmp)
+            if len(calls) == 1:
+                tmp.unlink()
+            return tmp
+
+        monkeypatch.setattr(cache, "_write_temp", write_then_lose)
+        cache.set("key", "value")
+        cache.close()
+
+        reopened = open_cache("cache")
+        assert reopened.get("key") == "value"
+
+    def test_schema_without_data_column_is_upgraded(self, open_cache, temp_dir):
+        """Test a database from before inline storage gains the column."""
+        (temp_dir / "old").mkdir()
+        conn = sqlite3.connect(temp_dir / "old" / "cache.db")
+        conn.execute(
+            "CREATE TABLE cache_entries (key TEXT PRIMARY KEY, created_at REAL NOT NULL, "
+            "expires_at REAL, compression TEXT NOT NULL, size_bytes INTEGER NOT NULL, "
+            "access_count INTEGER NOT NULL DEFAULT 0, last_accessed REAL NOT NULL)"
+        )
+        conn.commit()
+        conn.close()
+
+        open_cache("old").set("key", "value")
+
+        reopened = open_cache("old")
+        assert reopened.get("key") == "value"
+
+    def test_expired_entry_is_missing(self, cache):
+        """Test an entry past its TTL is treated as absent."""
+        cache.set("key", "value", ttl=-1)
+
+        assert cache.get("key") is None
+        assert not cache.exists("key")
+
+    def test_touch_renews_expiry(self, cache):
+        """Test touch() extends the TTL of an existing entry only."""
+        cache.set("key", "value", ttl=10)
+        before = cache.get_entry_info("key")["expires_at"]
+
+        assert cache.touch("key", ttl=3600)
+        assert cache.get_entry_info("key")["expires_at"] > before
+        assert not cache.touch("missing", ttl=3600)
+
+    def test_items_returns_live_entries(self, cache, open_cache):
+        """Test items() lists live persisted entries from memory and disk."""
+        cache.set("fresh", {"a": 1}, compress=True)
+        cache.set("stale", {"b": 2}, ttl=-1)
+
+        assert cache.items() == [("fresh", {"a": 1})]
+
+        reopened = open_cache("cache")
+        assert reopened.items() == [("fresh", {"a": 1})]
+
+    def test_peek_leaves_access_stats_alone(self, cache, open_cache):
+        """Test get(peek=True) does not count as an access."""
+        cache.set("key", "value")
+        reopened = open_cache("cache")
+
+        assert reopened.get("key", peek=True) == "value"
+        assert reopened.get_entry_info("key")["access_count"] == 0
+        assert reopened.get_entry_info("key")["in_memory"] is False
+
+    def test_evict_removes_least_used_entries(self, cache):
+        """Test evict() drops rarely read entries before popular ones."""
+        for key in ("a", "b", "c", "d"):
+            cache.set(key, key)
+        cache.get("a")
+        cache.get("c")
+        cache.get("d")
+
+        assert cache.evict(fraction=0.25) == 1
+        assert sorted(cache.keys()) == ["a", "c", "d"]
+
+    def test_max_disk_bytes_triggers_eviction(self, open_cache):
+        """Test writes past 90% of max_disk_bytes evict old entries."""
+        cache = open_cache("bounded", max_disk_bytes=100)
+        for i in range(20):
+            cache.set(f"k{i}", "x" * 8)
+
+        assert cache.stats()["total_size_bytes"] <= 100
+        assert "k19" in cache.keys()
+
+    def test_fresh_write_survives_capacity_eviction(self, open_cache):
+        """Test the entry just written is not the one evicted for space."""
+        cache = open_cache("bounded", max_disk_bytes=1000)
+        for i in range(8):
+            cache.set(f"k{i}", "x" * 100)
+            cache.get(f"k{i}")
+
+        cache.set("new", "y" * 100)
+
+        assert cache.exists("new")
+        assert not cache.exists("k0")
+
+    def test_live_keys_follow_writes_and_expiry(self, cache, monkeypatch):
+        """Test memoized keys() sees new writes and entries expiring."""
+        now = [1000.0]
+        monkeypatch.setattr(cache, "_now", lambda: now[0])
+        cache.set("short", 1, ttl=10)
+        assert cache.keys() == ["short"]
+
+        cache.set("long", 2)
+        assert sorted(cache.keys()) == ["long", "short"]
+
+        now[0] += 11
+        assert cache.keys() == ["long"]
+
+    def test_live_keys_see_other_managers(self, cache, open_cache):
+        """Test memoized keys() is dropped when another manager writes."""
+        cache.set("local", 1)
+        assert cache.keys() == ["local"]
+
+        other = open_cache("cache")
+        other.set("foreign", 2)
+        assert sorted(cache.keys()) == ["foreign", "local"]
+
+    def test_set_many_and_delete_many(self, cache, open_cache):
+        """Test batched writes and deletes persist like single ones."""
+        cache.set_many([("a", 1), ("b", 2), ("c", 3)], compress=True)
+        cache.delete_many(["a", "c"])
+
+        reopened = open_cache("cache")
+        assert reopened.keys() == ["b"]
+        assert reopened.get("b") == 2
+
+    def test_access_stats_are_written_in_batches(self, open_cache):
+        """Test disk reads queue access stats until a flush point."""
+        open_cache("cache").set("k", 1)
+        reader = open_cache("cache")
+        observer = open_cache("cache")
+
+        reader.get("k")
+        reader.get("k")
+        assert observer.get_entry_info("k")["access_count"] == 0
+
+        reader.close()
+        assert observer.get_entry_info("k")["access_count"] == 2
+
+    def test_set_resets_queued_access_stats(self, cache):
+        """Test re-setting a key drops accesses queued for the old value."""
+        cache.set("k", 1)
+        cache.get("k")
+        cache.get("k")
+        cache.set("k", 2)
+
+        cache._flush_stats()
+        assert cache.get_entry_info("k")["access_count"] == 0
+        cache._memory_cache.clear()
+        assert cache.get_entry_info("k")["access_count"] == 0
+
+    def test_memory_cache_evicts_least_recently_used(self, open_cache):
+        """Test the memory tier drops the entry read longest ago."""
+        cache = open_cache("lru", max_memory_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get_entry_info("a")["in_memory"] is True
+        assert cache.get_entry_info("b")["in_memory"] is False
+        assert cache.get("b") == 2
+
+    def test_bulk_delete_removes_every_file(self, open_cache, temp_dir):
+        """Test large deletes and clear() remove all files, in parallel."""
+        cache = open_cache("bulk", inline_threshold=0)
+        cache.set_many([(f"k{i}", i) for i in range(40)])
+        cache.delete_many([f"k{i}" for i in range(35)])
+        data_dir = temp_dir / "bulk" / "data"
+        assert len(list(data_dir.iterdir())) == 5
+
+        cache.clear()
+        assert list(data_dir.iterdir()) == []
+
+    @pytest.mark.parametrize("returning", [True, False])
+    def test_cleanup_removes_expired_rows_and_files(
+        self, open_cache, temp_dir, monkeypatch, returning
+    ):
+        """Test cleanup() with and without DELETE ... RETURNING."""
+        monkeypatch.setattr(sierra_internal_cache, "_HAS_RETURNING", returning)
+        cache = open_cache("gc", inline_threshold=4)
+        cache.set("gone_inline", 1, ttl=-1)
+        cache.set("gone_file", "x" * 10, ttl=-1)
+        cache.set("kept", "x" * 10)
+
+        cache.cleanup()
+        assert cache.keys(include_expired=True) == ["kept"]
+        assert len(list((temp_dir / "gc" / "data").iterdir())) == 1
+
+    def test_stats_counts_entries_size_and_expired(self, cache):
+        """Test stats() reports totals and expired entries in one call."""
+        cache.set("live", "ab")
+        cache.set("stale", "cd", ttl=-1)
+
+        stats = cache.stats()
+        assert stats["total_entries"] == 2
+        assert stats["expired_entries"] == 1
+        assert stats["total_size_bytes"] == 8
+
+    def test_delete_and_clear(self, cache):
+        """Test entries can be removed individually or all at once."""
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.delete("a")
+        assert cache.keys() == ["b"]
+
+        cache.clear()
+        assert cache.keys() == []
@@ -2,7 +2,7 @@
 Tests for UniversalLogger.
 """
 import pytest
-from sierra.internal.logger import UniversalLogger, LogLevel, LogType
+from sierra.internal.logger import LazyMessage, UniversalLogger, LogLevel, LogType
 
 
 class TestUniversalLogger:
@@ -62,6 +62,38 @@ class TestUniversalLogger:
         captured = capsys.readouterr()
         assert "Debug info" not in captured.out
     
+    def test_is_enabled_for(self):
+        """Test level check matches what log() would emit."""
+        logger = UniversalLogger(name="Test", level=LogLevel.STANDARD, enable_colors=False)
+        assert logger.is_enabled_for("error")
+        assert not logger.is_enabled_for("debug")
+    
+    def test_lazy_message_rendered_only_when_emitted(self, capsys):
+        """Test LazyMessage is built only for levels that are logged."""
+        calls = []
+
+        def build():
+            calls.append(1)
+            return "Lazy info"
+
+        logger = UniversalLogger(name="Test", level=LogLevel.STANDARD, enable_colors=False)
+        logger.log(LazyMessage(build), LogType.DEBUG)
+        assert calls == []
+
+        logger.log(LazyMessage(build), LogType.INFO)
+        captured = capsys.readouterr()
+        assert calls == [1]
+        assert "Lazy info" in captured.out
+    
+    def test_percent_args_formatted_only_when_emitted(self, capsys):
+        """Test %-style arguments are interpolated only for logged levels."""
+        logger = UniversalLogger(name="Test", level=LogLevel.STANDARD, enable_colors=False)
+        logger.log("Skipped %s", LogType.DEBUG, object())
+        assert capsys.readouterr().out == ""
+
+        logger.log("Cached %d of %d", LogType.INFO, 3, 4)
+        assert "Cached 3 of 4" in capsys.readouterr().out
+    
     def test_emoji_icons_in_output(self, capsys):
         """Test that emoji icons appear in output."""
         logger = UniversalLogger(name="Test", enable_colors=False)